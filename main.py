@@ -13,7 +13,7 @@ import argparse
 import logging
 import sys
 
-from parser.server import create_app, app
+from parser.server import app, run_server
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,16 +28,18 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="Bind host")
     parser.add_argument("--port", type=int, default=5000, help="Bind port")
     parser.add_argument("--debug", action="store_true", help="Debug mode")
+    parser.add_argument(
+        "--gunicorn", action="store_true", default=None,
+        help="Serve with gunicorn (default: PARSER_USE_GUNICORN, else off)")
     args = parser.parse_args()
 
-    # create_app() handles init_storage() + init_db() internally
-    logger.info("Creating Flask app (initializes DB + storage)...")
-    create_app()
-
+    # run_server() calls create_app(), which handles init_storage() +
+    # init_db(); under gunicorn, parser.wsgi does it in the worker instead
     from parser.database import get_db_path
     logger.info(f"Database path: {get_db_path()}")
     logger.info(f"Starting server on {args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    run_server(host=args.host, port=args.port, debug=args.debug,
+               use_gunicorn=args.gunicorn)
 
 
 if __name__ == "__main__":
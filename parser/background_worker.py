@@ -5,7 +5,8 @@ Handles page-level PDF parsing with checkpointing, pause/resume,
 and crash recovery.
 
 Architecture:
-    - Each exam gets its own worker thread
+    - Each exam gets its own worker thread; at most
+      PARSER_BACKGROUND_WORKERS (default 2) of them parse at a time
     - Worker processes one page at a time
     - After each page: saves completed questions, commits, updates checkpoint
     - Checks DB status before each page (for pause detection)
@@ -47,6 +48,12 @@ logger = logging.getLogger(__name__)
 _active_workers: dict[int, "BackgroundParserWorker"] = {}
 _workers_lock = threading.Lock()
 
+# Caps how many exams parse at once; extra workers stay registered (so
+# pause/cancel still reach them) and wait here with the exam still pending.
+MAX_CONCURRENT_WORKERS = max(1, int(
+    os.environ.get("PARSER_BACKGROUND_WORKERS", "2")))
+_parse_slots = threading.BoundedSemaphore(MAX_CONCURRENT_WORKERS)
+
 
 def get_worker(exam_id: int) -> Optional["BackgroundParserWorker"]:
     """Get the active worker for an exam, if any."""
@@ -123,7 +130,12 @@ class BackgroundParserWorker:
             _active_workers[self.exam_id] = self
 
         try:
-            self._run_internal(start_from_page)
+            with _parse_slots:
+                if self._stop_requested:
+                    logger.info(
+                        f"Exam {self.exam_id}: Stopped before parsing started")
+                    return
+                self._run_internal(start_from_page)
         finally:
             # Unregister
             with _workers_lock:
@@ -134,6 +146,7 @@ class BackgroundParserWorker:
     def _run_internal(self, start_from_page: int):
         """Internal parsing loop with full error handling."""
         doc = None
+        writer = db.QuestionBatchWriter(self.exam_id)
         try:
             # Mark as processing
             db.update_exam(self.exam_id, status="processing", last_error=None)
@@ -189,7 +202,7 @@ class BackgroundParserWorker:
             for page_num in range(process_from, total_pages + 1):
                 # Check for stop signal (in-memory, fast)
                 if self._stop_requested:
-                    db.update_exam(self.exam_id, status="paused")
+                    db.update_exam_status(self.exam_id, "paused")
                     logger.info(
                         f"Exam {self.exam_id}: Paused at page {page_num} "
                         f"(stop requested)"
@@ -219,11 +232,13 @@ class BackgroundParserWorker:
                 new_questions = state_machine.questions[prev_count:]
 
                 # Save with idempotency (delete + insert for each question)
+                # and commit them together with the page checkpoint
+                writer.begin()
                 for q in new_questions:
-                    self._save_question(q, image_dir, exam_name)
-
-                # Update checkpoint
-                db.update_exam(self.exam_id, current_page=page_num)
+                    self._save_question(writer, q, image_dir)
+                db.update_exam_current_page(
+                    self.exam_id, page_num, join=True)
+                writer.checkpoint()
 
                 if new_questions:
                     logger.info(
@@ -237,7 +252,8 @@ class BackgroundParserWorker:
                 state_machine.finalize()
                 final_questions = state_machine.questions[prev_count:]
                 for q in final_questions:
-                    self._save_question(q, image_dir, exam_name)
+                    self._save_question(writer, q, image_dir)
+                writer.checkpoint()
 
             # ── Run validation ────────────────────────────────────────
             total_questions = len(state_machine.questions)
@@ -283,6 +299,9 @@ class BackgroundParserWorker:
             error_msg = f"{e}\n{tb}"
             logger.error(f"Exam {self.exam_id}: Parsing FAILED — {error_msg}")
 
+            # Drop the partially written page; earlier pages are committed
+            writer.rollback()
+
             # Mark as failed, preserve already-parsed data
             db.update_exam(
                 self.exam_id,
@@ -340,21 +359,17 @@ class BackgroundParserWorker:
 
     # ─── Question Persistence ─────────────────────────────────────────────
 
-    def _save_question(self, q, image_dir: Path, exam_name: str):
+    def _save_question(
+        self, writer: db.QuestionBatchWriter, q, image_dir: Path
+    ):
         """
-        Save a single ParsedQuestion to DB with idempotency.
-        Deletes any existing question with the same number first.
+        Write a single ParsedQuestion through the batch writer with
+        idempotency (any existing question with the same number is
+        replaced). Committed at the next page checkpoint.
         """
         q_dict = q.model_dump()
         q_dict = self._remap_question_images(q_dict, image_dir)
-
-        # Idempotency: delete existing question with same number
-        db.delete_question_by_exam_and_number(
-            self.exam_id, q.question_number
-        )
-
-        # Insert
-        db.insert_single_question(self.exam_id, q_dict)
+        writer.add(q_dict)
 
     def _remap_question_images(self, q_dict: dict, image_dir: Path) -> dict:
         """
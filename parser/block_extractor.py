@@ -19,6 +19,9 @@ from .models import BlockType, ContentBlock, FontInfo
 
 logger = logging.getLogger(__name__)
 
+# Blocks and font info are built with model_construct(): every value comes
+# straight from PyMuPDF already typed, so per-block validation is skipped.
+
 
 class BlockExtractor:
     """
@@ -41,6 +44,9 @@ class BlockExtractor:
         self.min_image_size = min_image_size
         self.dpi = dpi
 
+        # Page count of the document seen by the last extract() call
+        self.last_page_count: Optional[int] = None
+
         self.image_output_dir.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
@@ -96,7 +102,7 @@ class BlockExtractor:
                     font_info = None
                     if block.get("lines") and block["lines"][0].get("spans"):
                         span = block["lines"][0]["spans"][0]
-                        font_info = FontInfo(
+                        font_info = FontInfo.model_construct(
                             name=span.get("font"),
                             size=span.get("size"),
                             flags=span.get("flags"),
@@ -105,7 +111,7 @@ class BlockExtractor:
                             is_italic=bool(span.get("flags", 0) & 1),
                         )
 
-                    current_page_blocks.append(ContentBlock(
+                    current_page_blocks.append(ContentBlock.model_construct(
                         type=BlockType.TEXT,
                         content=text_content,
                         page_number=page_num,
@@ -143,6 +149,7 @@ class BlockExtractor:
 
         with fitz.open(pdf_path) as doc:
             total_pages = doc.page_count
+            self.last_page_count = total_pages
 
             # Determine page range (1-indexed)
             start_page = 1
@@ -184,7 +191,7 @@ class BlockExtractor:
                             font_info = None
                             if block.get("lines") and block["lines"][0].get("spans"):
                                 span = block["lines"][0]["spans"][0]
-                                font_info = FontInfo(
+                                font_info = FontInfo.model_construct(
                                     name=span.get("font"),
                                     size=span.get("size"),
                                     flags=span.get("flags"),
@@ -193,7 +200,7 @@ class BlockExtractor:
                                     is_italic=bool(span.get("flags", 0) & 1),
                                 )
 
-                            current_page_blocks.append(ContentBlock(
+                            current_page_blocks.append(ContentBlock.model_construct(
                                 type=BlockType.TEXT,
                                 content=text_content,
                                 page_number=page_num,
@@ -271,7 +278,7 @@ class BlockExtractor:
                 if bbox_obj.width < 1 or bbox_obj.height < 1:
                     continue
 
-                image_blocks.append(ContentBlock(
+                image_blocks.append(ContentBlock.model_construct(
                     type=BlockType.IMAGE,
                     content=cached["rel_path"],
                     page_number=page_num,
@@ -342,7 +349,7 @@ class BlockExtractor:
                 self._image_cache[xref] = {
                     "rel_path": rel_path, "is_logo": False}
 
-                image_blocks.append(ContentBlock(
+                image_blocks.append(ContentBlock.model_construct(
                     type=BlockType.IMAGE,
                     content=rel_path,
                     page_number=page_num,
@@ -117,6 +117,19 @@ def cli():
     default=False,
     help="Skip saving raw blocks snapshot",
 )
+@click.option(
+    "--gzip-raw-blocks",
+    default=0,
+    type=int,
+    help="Gzip raw blocks snapshots with more blocks than this, "
+         "saved as *_raw_blocks.json.gz (0 = never)",
+)
+@click.option(
+    "--pretty-json",
+    is_flag=True,
+    default=False,
+    help="Indent the saved JSON files (compact by default)",
+)
 @click.option(
     "--json-output",
     is_flag=True,
@@ -138,6 +151,8 @@ def parse(
     log_level: str,
     log_file: str,
     no_raw_blocks: bool,
+    gzip_raw_blocks: int,
+    pretty_json: bool,
     json_output: bool,
 ):
     """Parse a single PDF file into structured question entities."""
@@ -163,6 +178,8 @@ def parse(
         log_level=log_level,
         log_file=log_file,
         save_raw_blocks=not no_raw_blocks,
+        raw_blocks_gzip_threshold=gzip_raw_blocks,
+        pretty_json=pretty_json,
     )
 
     if not json_output:
@@ -326,7 +343,13 @@ def validate(json_path: str):
 @click.option("--host", default="0.0.0.0", help="Server host")
 @click.option("--port", default=5000, type=int, help="Server port")
 @click.option("--debug", is_flag=True, default=False, help="Debug mode")
-def serve(host: str, port: int, debug: bool):
+@click.option(
+    "--gunicorn/--no-gunicorn",
+    default=None,
+    help="Serve with gunicorn gthread workers "
+         "(default: PARSER_USE_GUNICORN, else off)",
+)
+def serve(host: str, port: int, debug: bool, gunicorn: bool):
     """Start the HTTP microservice server for Laravel integration."""
     from .server import run_server
 
@@ -340,7 +363,7 @@ def serve(host: str, port: int, debug: bool):
     )
     console.print()
 
-    run_server(host=host, port=port, debug=debug)
+    run_server(host=host, port=port, debug=debug, use_gunicorn=gunicorn)
 
 
 @cli.command()
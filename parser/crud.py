@@ -8,9 +8,15 @@ This is the ONLY layer that should be called from API endpoints.
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
+import multiprocessing
 import os
 import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +27,18 @@ from .models import ParseResult
 
 logger = logging.getLogger(__name__)
 
+# Background I/O for work that can overlap with CPU-bound parsing
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="crud-io")
+
+# Parsing is CPU-bound, so it runs in worker processes to keep concurrent
+# uploads from serialising on the GIL. Workers are recycled periodically
+# so memory retained by the PDF library is released (Python 3.11+; 3.10's
+# ProcessPoolExecutor has no max_tasks_per_child, so workers live on there).
+_PARSE_WORKER_MAX_TASKS = 10
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_progress_manager = None
+_pool_lock = threading.Lock()
+
 
 # ─── Upload & Parse (Main Flow) ──────────────────────────────────────────────
 
@@ -37,6 +55,7 @@ def upload_and_parse(
     Full upload→parse→persist pipeline.
 
     Steps:
+        0. Reuse an existing exam if the same PDF was already parsed
         1. Save PDF to uploads/raw_pdfs/
         2. Insert exam record into SQLite
         3. Parse PDF (extract blocks, run FSM, validate)
@@ -53,7 +72,8 @@ def upload_and_parse(
         progress_callback: Optional callback(current_page, total_pages).
 
     Returns:
-        dict with exam_id and total_questions.
+        dict with exam_id, question counts and whether an existing
+        exam was reused.
     """
     pdf_path = os.path.abspath(pdf_path)
     if not os.path.exists(pdf_path):
@@ -67,9 +87,24 @@ def upload_and_parse(
     logger.info(f"[upload_and_parse] DB path: {db_path}")
     logger.info(f"[upload_and_parse] Starting pipeline for: {filename}")
 
-    # ── Step 1: Save PDF persistently ─────────────────────────────────
-    stored_pdf_path = storage.save_pdf(pdf_path, filename)
-    logger.info(f"[upload_and_parse] PDF stored at: {stored_pdf_path}")
+    # ── Step 0: Fail fast on an already-parsed PDF ───────────────────
+    file_hash = storage.compute_file_hash(pdf_path)
+    existing = db.find_exam_by_hash(file_hash)
+    if existing and existing.get("total_questions"):
+        logger.info(
+            f"[upload_and_parse] Duplicate upload (hash={file_hash[:12]}) — "
+            f"reusing exam_id={existing['id']}"
+        )
+        return {
+            "exam_id": existing["id"],
+            "parsed_questions": existing["total_questions"],
+            "stored_questions": existing["total_questions"],
+            "db_path": db_path,
+            "reused": True,
+        }
+
+    # ── Step 1: Save PDF persistently (overlaps with parsing) ────────
+    save_future = _io_pool.submit(storage.save_pdf, pdf_path, filename)
 
     # ── Step 2: Setup image directory ─────────────────────────────────
     image_dir = storage.get_exam_image_dir(name)
@@ -86,9 +121,7 @@ def upload_and_parse(
         exam_id=storage._sanitize_name(name),
     )
 
-    engine = ParserEngine(config)
-    result: ParseResult = engine.parse(
-        pdf_path, progress_callback=progress_callback)
+    result = parse_in_pool(pdf_path, config, progress_callback)
 
     parsed_count = len(result.questions)
     logger.info(f"[upload_and_parse] Parsed question count: {parsed_count}")
@@ -106,6 +139,9 @@ def upload_and_parse(
         result, exam_id_dir, image_dir, name
     )
 
+    stored_pdf_path = save_future.result()
+    logger.info(f"[upload_and_parse] PDF stored at: {stored_pdf_path}")
+
     # ── Step 5 + 6: Insert into SQLite (atomic) ──────────────────────
     exam_id = None
     try:
@@ -123,7 +159,7 @@ def upload_and_parse(
         )
         logger.info(f"[upload_and_parse] Inserted exam row id={exam_id}")
 
-        db.bulk_insert_questions(exam_id, questions_data)
+        db.bulk_insert_questions(exam_id, questions_data, bulk_mode=True)
         logger.info(
             f"[upload_and_parse] Bulk-inserted {parsed_count} questions for exam_id={exam_id}")
 
@@ -166,9 +202,99 @@ def upload_and_parse(
         "parsed_questions": parsed_count,
         "stored_questions": stored_count,
         "db_path": db_path,
+        "reused": False,
     }
 
 
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared parse worker pool."""
+    global _parse_pool
+    with _pool_lock:
+        if _parse_pool is None:
+            kwargs = {}
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = _PARSE_WORKER_MAX_TASKS
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+                **kwargs,
+            )
+        return _parse_pool
+
+
+def _get_progress_queue():
+    """Create a queue that can be handed to a parse worker process."""
+    global _progress_manager
+    with _pool_lock:
+        if _progress_manager is None:
+            _progress_manager = multiprocessing.get_context("spawn").Manager()
+        return _progress_manager.Queue()
+
+
+@functools.lru_cache(maxsize=4)
+def _worker_engine(log_level: str, log_file: Optional[str]) -> ParserEngine:
+    """
+    Warm engine for this worker process, keyed by the settings its
+    constructor acts on (logging). Per-job settings are swapped in by
+    replacing engine.config; workers run one task at a time, so that's safe.
+    """
+    return ParserEngine(ParserConfig(log_level=log_level, log_file=log_file))
+
+
+def _parse_in_worker(
+    pdf_path: str,
+    config_dict: dict,
+    progress_queue=None,
+) -> ParseResult:
+    """Run the parser engine inside a worker process."""
+    def report_progress(current, total):
+        progress_queue.put((current, total))
+
+    callback = report_progress if progress_queue is not None else None
+    config = ParserConfig(**config_dict)
+    engine = _worker_engine(config.log_level, config.log_file)
+    engine.config = config
+    return engine.parse(pdf_path, progress_callback=callback)
+
+
+def parse_in_pool(
+    pdf_path: str,
+    config: ParserConfig,
+    progress_callback=None,
+) -> ParseResult:
+    """
+    Parse a PDF in the worker pool and wait for the result.
+    Progress reported by the worker is relayed to ``progress_callback``
+    from a local thread.
+    """
+    if progress_callback is None:
+        return _get_parse_pool().submit(
+            _parse_in_worker, pdf_path, dataclasses.asdict(config)
+        ).result()
+
+    queue = _get_progress_queue()
+
+    def relay():
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            try:
+                progress_callback(*item)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+    relay_thread = threading.Thread(target=relay, daemon=True)
+    relay_thread.start()
+    try:
+        return _get_parse_pool().submit(
+            _parse_in_worker, pdf_path, dataclasses.asdict(config), queue
+        ).result()
+    finally:
+        queue.put(None)
+        relay_thread.join()
+
+
 def _remap_image_paths(
     result: ParseResult,
     source_dir: Path,
@@ -180,32 +306,41 @@ def _remap_image_paths(
     and return questions data with updated relative paths.
     """
     project_root = storage.get_project_root()
-    questions_data = []
+    source_dir = source_dir.resolve()
+    target_dir = target_dir.resolve()
 
-    for q in result.questions:
-        q_dict = q.model_dump()
-
-        # Process each image list
-        q_dict["question_images"] = [
-            _move_and_relativize(p, source_dir, target_dir, project_root)
-            for p in q_dict.get("question_images", [])
-        ]
-        q_dict["answer_images"] = [
-            _move_and_relativize(p, source_dir, target_dir, project_root)
-            for p in q_dict.get("answer_images", [])
-        ]
-        q_dict["explanation_images"] = [
+    def remap(paths: list[str]) -> list[str]:
+        return [
             _move_and_relativize(p, source_dir, target_dir, project_root)
-            for p in q_dict.get("explanation_images", [])
+            for p in paths
         ]
 
-        for opt in q_dict.get("options", []):
-            opt["images"] = [
-                _move_and_relativize(p, source_dir, target_dir, project_root)
-                for p in opt.get("images", [])
-            ]
-
-        questions_data.append(q_dict)
+    # Build only the fields bulk_insert_questions reads, straight from
+    # the model attributes rather than a full model_dump().
+    questions_data = []
+    for q in result.questions:
+        questions_data.append({
+            "question_number": q.question_number,
+            "question_type": q.question_type.value,
+            "question_text": q.question_text,
+            "question_images": remap(q.question_images),
+            "options": [
+                {
+                    "key": opt.key,
+                    "text": opt.text,
+                    "is_correct": opt.is_correct,
+                    "images": remap(opt.images),
+                }
+                for opt in q.options
+            ],
+            "answer_text": q.answer_text,
+            "answer_images": remap(q.answer_images),
+            "explanation_text": q.explanation_text,
+            "explanation_images": remap(q.explanation_images),
+            "page_start": q.page_start,
+            "page_end": q.page_end,
+            "raw_text": q.raw_text,
+        })
 
     return questions_data
 
@@ -220,6 +355,8 @@ def _move_and_relativize(
     Given an image reference (relative path like 'questions/exam/img.png'
     or just a filename), ensure the file is in target_dir and return
     a relative path from project root.
+
+    source_dir and target_dir are expected to be already resolved.
     """
     if not image_ref:
         return image_ref
@@ -247,7 +384,7 @@ def _move_and_relativize(
     dest_file = target_dir / src_file.name
 
     # Move if source != destination
-    if src_file.resolve() != dest_file.resolve():
+    if not (dest_file.exists() and os.path.samefile(src_file, dest_file)):
         shutil.copy2(str(src_file), str(dest_file))
 
     # Return relative path from project root
@@ -265,7 +402,8 @@ def get_exam(exam_id: int) -> Optional[dict]:
     Get full exam with all questions from SQLite.
     Never re-parses. Returns None if not found.
     """
-    exam = db.get_exam(exam_id)
+    exam = db.get_exam(
+        exam_id, include_blobs=True, kinds=("validation_json",))
     if not exam:
         return None
 
@@ -623,6 +761,8 @@ def enrich_result_with_blocks(result_dict: dict) -> dict:
     """
     Walk all questions in a result dict and add ``blocks`` structure
     so the UI can render them. Mutates in-place and returns the dict.
+    Questions that already have ``blocks`` are left as they are, so
+    repeat calls only cost a key check per question.
     """
     for q in result_dict.get("questions", []):
         if "blocks" not in q:
@@ -733,6 +873,8 @@ def _question_to_blocks(q: dict) -> dict:
 def _format_question(q: dict) -> dict:
     """
     Format a hydrated question dict into the exact structure the UI expects.
+    ``image_count`` is taken from the hydration step, which already counted
+    the question's image rows.
 
     Output:
         question_number, question_text, question_images,
@@ -758,11 +900,6 @@ def _format_question(q: dict) -> dict:
         "has_question_text": bool(q.get("question_text", "").strip()),
         "has_answer": bool(q.get("answer_text", "").strip()),
         "has_explanation": bool(q.get("explanation_text", "").strip()),
-        "image_count": (
-            len(q.get("question_images", []))
-            + len(q.get("answer_images", []))
-            + len(q.get("explanation_images", []))
-            + sum(len(o.get("images", [])) for o in q.get("options", []))
-        ),
+        "image_count": q.get("image_count", 0),
     }
     return _question_to_blocks(result)
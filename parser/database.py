@@ -8,13 +8,19 @@ No in-memory caching — always reads from disk.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import itertools
 import logging
 import os
 import sqlite3
+import threading
+import weakref
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +28,338 @@ logger = logging.getLogger(__name__)
 _DEFAULT_DB_PATH = str(Path(__file__).parent.parent / "database.sqlite")
 
 
+# Bumped whenever _migrate_add_columns gains a migration; stored in the
+# database file as PRAGMA user_version.
+_SCHEMA_VERSION = 5
+
+# exams columns whose values live in exam_blobs, keyed by kind
+_BLOB_KINDS = ("result_json", "validation_json")
+
+
 def get_db_path() -> str:
     """Return the configured database path."""
     return os.environ.get("PARSER_DB_PATH", _DEFAULT_DB_PATH)
 
 
+def get_blobs_db_path(db_path: str = None) -> str:
+    """
+    Return the path of the side database holding exam JSON blobs.
+    Defaults to ``<db stem>_blobs<suffix>`` next to the main database.
+    """
+    env_path = os.environ.get("PARSER_BLOBS_DB_PATH")
+    if env_path:
+        return env_path
+    p = Path(db_path or get_db_path())
+    return str(p.with_name(f"{p.stem}_blobs{p.suffix}"))
+
+
+# ─── SQL Statements ───────────────────────────────────────────────────────────
+# Kept at module level so each call passes the same string object and
+# sqlite3's per-connection statement cache returns the prepared statement.
+
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries use lastrowid.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING_ID = " RETURNING id" if _HAS_RETURNING else ""
+
+# exams
+# Every exams column except the large result_json / validation_json blobs
+_EXAM_SUMMARY_COLUMNS = """id, job_id, name, file_path, source_pdf, file_hash,
+    file_size_bytes, total_pages, total_questions, provider, version,
+    parser_version, original_filename, status, current_page, last_error,
+    created_at"""
+_SQL_INSERT_EXAM = """INSERT INTO exams
+    (name, file_path, source_pdf, file_hash, file_size_bytes,
+     total_pages, total_questions, provider, version, parser_version,
+     job_id, result_json, original_filename)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""" + _RETURNING_ID
+_SQL_SELECT_EXAM = (
+    f"SELECT {_EXAM_SUMMARY_COLUMNS} FROM exams WHERE id = ?")
+_SQL_LIST_EXAMS = (
+    f"SELECT {_EXAM_SUMMARY_COLUMNS} FROM exams ORDER BY created_at DESC")
+# Just what /api/jobs shows; job ids already listed from memory are
+# excluded in SQL (appended as "AND job_id NOT IN (...)")
+_SQL_LIST_EXAMS_SUMMARY = """SELECT id, job_id, name, original_filename,
+    file_path, created_at, total_questions, status
+    FROM exams WHERE job_id IS NOT NULL AND job_id != ''"""
+# Stay under SQLite's default host-parameter limit (999 before 3.32)
+_MAX_SQL_PARAMS = 900
+_SQL_DELETE_EXAM = "DELETE FROM exams WHERE id = ?"
+_SQL_SELECT_EXAM_BY_JOB_ID = (
+    f"SELECT {_EXAM_SUMMARY_COLUMNS} FROM exams WHERE job_id = ?")
+_SQL_SELECT_EXAM_BY_HASH = f"""SELECT {_EXAM_SUMMARY_COLUMNS} FROM exams
+    WHERE file_hash = ?
+    ORDER BY id DESC LIMIT 1"""
+_SQL_EXAM_EXISTS = "SELECT 1 FROM exams WHERE id = ?"
+_SQL_UPDATE_EXAM_STATUS = "UPDATE exams SET status = ? WHERE id = ?"
+_SQL_UPDATE_EXAM_CURRENT_PAGE = "UPDATE exams SET current_page = ? WHERE id = ?"
+
+# exam_blobs (result_json / validation_json) lives in the attached
+# "blobs" database so blob writes don't contend with question writes
+_SQL_UPSERT_EXAM_BLOB = """INSERT INTO blobs.exam_blobs (exam_id, kind, data)
+    VALUES (?, ?, ?)
+    ON CONFLICT(exam_id, kind) DO UPDATE SET data = excluded.data"""
+_SQL_SELECT_EXAM_BLOBS = (
+    "SELECT kind, data FROM blobs.exam_blobs WHERE exam_id = ?")
+_SQL_SELECT_EXAM_BLOB = (
+    "SELECT data FROM blobs.exam_blobs WHERE exam_id = ? AND kind = ?")
+_SQL_DELETE_EXAM_BLOBS = "DELETE FROM blobs.exam_blobs WHERE exam_id = ?"
+
+# questions
+_SQL_INSERT_QUESTION = """INSERT INTO questions
+    (exam_id, question_number, question_type, question_text,
+     answer_text, explanation_text, page_start, page_end, raw_text)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""" + _RETURNING_ID
+_SQL_INSERT_QUESTION_WITH_ID = """INSERT INTO questions
+    (id, exam_id, question_number, question_type, question_text,
+     answer_text, explanation_text, page_start, page_end, raw_text)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_NEXT_QUESTION_ID = """SELECT MAX(
+    COALESCE((SELECT seq FROM sqlite_sequence
+              WHERE name = 'questions'), 0),
+    COALESCE((SELECT MAX(id) FROM questions), 0))"""
+_SQL_SELECT_QUESTION = "SELECT * FROM questions WHERE id = ?"
+_SQL_SELECT_QUESTION_BY_NUMBER = """SELECT * FROM questions
+    WHERE exam_id = ? AND question_number = ?"""
+_SQL_SELECT_EXAM_QUESTIONS = """SELECT * FROM questions
+    WHERE exam_id = ?
+    ORDER BY question_number"""
+_SQL_COUNT_EXAM_QUESTIONS = (
+    "SELECT COUNT(*) as cnt FROM questions WHERE exam_id = ?")
+_SQL_DELETE_QUESTION = "DELETE FROM questions WHERE id = ?"
+_SQL_DELETE_QUESTION_BY_NUMBER = (
+    "DELETE FROM questions WHERE exam_id = ? AND question_number = ?")
+_SQL_DELETE_QUESTIONS_FROM_PAGE = (
+    "DELETE FROM questions WHERE exam_id = ? AND page_start >= ?")
+_SQL_DELETE_OPTIONS_FROM_PAGE = """DELETE FROM options
+    WHERE question_id IN (
+        SELECT id FROM questions WHERE exam_id = ? AND page_start >= ?)"""
+_SQL_DELETE_IMAGES_FROM_PAGE = """DELETE FROM question_images
+    WHERE question_id IN (
+        SELECT id FROM questions WHERE exam_id = ? AND page_start >= ?)"""
+
+# options
+_SQL_INSERT_OPTION = """INSERT INTO options
+    (question_id, option_key, option_text, is_correct)
+    VALUES (?, ?, ?, ?)"""
+_SQL_INSERT_OPTION_RETURNING_ID = _SQL_INSERT_OPTION + _RETURNING_ID
+_SQL_SELECT_QUESTION_OPTIONS = """SELECT option_key, option_text, is_correct
+    FROM options
+    WHERE question_id = ? ORDER BY option_key"""
+_SQL_SELECT_EXAM_OPTIONS = """SELECT o.question_id, o.option_key, o.option_text,
+           o.is_correct
+    FROM options o
+    JOIN questions q ON o.question_id = q.id
+    WHERE q.exam_id = ?
+    ORDER BY o.question_id, o.option_key"""
+_SQL_DELETE_OPTION = "DELETE FROM options WHERE id = ?"
+
+# question_images
+_SQL_INSERT_IMAGE = """INSERT INTO question_images
+    (question_id, section, option_key, image_path, block_order)
+    VALUES (?, ?, ?, ?, ?)"""
+_SQL_INSERT_IMAGE_RETURNING_ID = _SQL_INSERT_IMAGE + _RETURNING_ID
+_SQL_SELECT_QUESTION_IMAGES = """SELECT * FROM question_images
+    WHERE question_id = ?
+    ORDER BY section, block_order"""
+_SQL_HYDRATE_QUESTION_IMAGES = """SELECT section, option_key, image_path
+    FROM question_images
+    WHERE question_id = ?
+    ORDER BY section, block_order"""
+_SQL_SELECT_EXAM_IMAGES = """SELECT i.question_id, i.section, i.option_key,
+           i.image_path
+    FROM question_images i
+    JOIN questions q ON i.question_id = q.id
+    WHERE q.exam_id = ?
+    ORDER BY i.question_id, i.section, i.block_order"""
+_SQL_SELECT_QUESTION_IMAGE_PATHS = (
+    "SELECT image_path FROM question_images WHERE question_id = ?")
+_SQL_SELECT_EXAM_IMAGE_PATHS = """SELECT image_path FROM question_images
+    WHERE question_id IN (SELECT id FROM questions WHERE exam_id = ?)"""
+_SQL_SELECT_IMAGE_PATH = "SELECT image_path FROM question_images WHERE id = ?"
+_SQL_DELETE_IMAGE = "DELETE FROM question_images WHERE id = ?"
+
+
+# ─── Connections ──────────────────────────────────────────────────────────────
+
+
+class _ThreadConnections:
+    """Per-thread map of db_path -> open connection."""
+
+    __slots__ = ("conns", "__weakref__")
+
+    def __init__(self):
+        self.conns: dict[str, sqlite3.Connection] = {}
+
+
+# Per-connection settings, applied once when a connection is opened.
+# journal_mode=WAL is persisted in the database file, so init_db sets it.
+# Read-only connections skip the write-side settings.
+_READ_PRAGMAS = """
+    PRAGMA cache_size=-65536;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=1073741824;
+    PRAGMA analysis_limit=1000;
+"""
+_WRITE_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA blobs.synchronous=NORMAL;
+    PRAGMA foreign_keys=ON;
+""" + _READ_PRAGMAS
+
+# One connection per (thread, db_path), reused across calls. Holders are
+# tracked weakly so connections of finished threads are released with them.
+_tls = threading.local()
+_holders: "weakref.WeakSet[_ThreadConnections]" = weakref.WeakSet()
+_holders_lock = threading.Lock()
+
+
+def _get_conn(db_path: str, readonly: bool = False) -> sqlite3.Connection:
+    """Return this thread's cached connection for db_path, opening it once."""
+    holder = getattr(_tls, "holder", None)
+    if holder is None:
+        holder = _tls.holder = _ThreadConnections()
+        with _holders_lock:
+            _holders.add(holder)
+
+    key = f"ro:{db_path}" if readonly else db_path
+    conn = holder.conns.get(key)
+    if conn is None:
+        if readonly:
+            uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, isolation_level=None, check_same_thread=False,
+                cached_statements=256)
+        else:
+            conn = sqlite3.connect(
+                db_path, isolation_level=None, check_same_thread=False,
+                cached_statements=256)
+        if readonly:
+            # Only read connections hand rows back to callers; write
+            # connections keep plain tuples
+            conn.row_factory = sqlite3.Row
+        blobs_path = get_blobs_db_path(db_path)
+        if readonly:
+            blobs_path = Path(blobs_path).resolve().as_uri() + "?mode=ro"
+        conn.execute("ATTACH DATABASE ? AS blobs", (blobs_path,))
+        conn.executescript(_READ_PRAGMAS if readonly else _WRITE_PRAGMAS)
+        holder.conns[key] = conn
+    return conn
+
+
+def close_connections():
+    """
+    Run PRAGMA optimize and close every cached connection (at exit).
+    Read connections close first so the last write connection can
+    truncate the WAL without waiting on them.
+    """
+    with _holders_lock:
+        holders = list(_holders)
+    conns = [
+        (key, conn) for holder in holders for key, conn in holder.conns.items()]
+    conns.sort(key=lambda item: not item[0].startswith("ro:"))
+    for key, conn in conns:
+        try:
+            conn.execute("PRAGMA optimize")
+            if not key.startswith("ro:") and not conn.in_transaction:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            pass
+        conn.close()
+    for holder in holders:
+        holder.conns.clear()
+
+
+atexit.register(close_connections)
+
+
+_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+def checkpoint_db(db_path: str = None, mode: str = "PASSIVE"):
+    """
+    Checkpoint the WAL back into the database files.
+
+    Returns SQLite's (busy, wal_pages, checkpointed_pages) row, or None
+    inside a transaction. PASSIVE (the default, safe on hot paths) copies
+    what it can without waiting and never blocks on readers. FULL,
+    RESTART and TRUNCATE invoke the busy handler and can wait up to
+    busy_timeout for open readers, so keep them to idle/maintenance code.
+    """
+    mode = mode.upper()
+    if mode not in _CHECKPOINT_MODES:
+        raise ValueError(f"Unknown checkpoint mode: {mode}")
+    conn = _get_conn(db_path or get_db_path())
+    if conn.in_transaction:
+        return None
+    return conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+
+
 @contextmanager
-def get_connection(db_path: str = None):
+def get_connection(
+    db_path: str = None, immediate: bool = False, join: bool = False,
+):
     """
     Context manager for database connections.
-    Ensures proper commit/rollback and connection cleanup.
+    Yields this thread's cached connection inside a transaction and
+    commits or rolls back on exit. ``immediate`` takes the write lock up
+    front. Nested ``get_connection`` blocks join the outer transaction.
+
+    A transaction opened some other way (a ``QuestionBatchWriter`` batch)
+    is only joined with ``join=True``; the work then commits or rolls back
+    with that batch. Without it, finding such a transaction raises
+    ``sqlite3.ProgrammingError`` rather than silently deferring the commit.
     """
     db_path = db_path or get_db_path()
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    conn = _get_conn(db_path)
+    depths = _tx_depths()
+    if conn.in_transaction:
+        if not depths.get(db_path) and not join:
+            raise sqlite3.ProgrammingError(
+                "get_connection() found an open batch transaction on this "
+                "thread; pass join=True to write inside it")
+        depths[db_path] = depths.get(db_path, 0) + 1
+        try:
+            yield conn
+        finally:
+            depths[db_path] -= 1
+        return
+
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    depths[db_path] = 1
     try:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
         raise
     finally:
-        conn.close()
+        depths[db_path] = 0
+
+
+def _tx_depths() -> dict[str, int]:
+    """This thread's get_connection nesting depth per db_path."""
+    depths = getattr(_tls, "tx_depths", None)
+    if depths is None:
+        depths = _tls.tx_depths = {}
+    return depths
+
+
+@contextmanager
+def get_read_connection(db_path: str = None):
+    """
+    Context manager for read-only access on the hot read paths.
+    Uses a separate cached ``mode=ro`` connection and a read transaction
+    so multi-statement reads see one consistent snapshot.
+    """
+    conn = _get_conn(db_path or get_db_path(), readonly=True)
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        conn.execute("COMMIT")
 
 
 def init_db(db_path: str = None):
@@ -56,6 +370,11 @@ def init_db(db_path: str = None):
     db_path = db_path or get_db_path()
     logger.info(f"Initializing database at: {db_path}")
 
+    # WAL must be switched outside a transaction; it persists in the file.
+    conn = _get_conn(db_path)
+    conn.execute("PRAGMA main.journal_mode=WAL")
+    conn.execute("PRAGMA blobs.journal_mode=WAL")
+
     with get_connection(db_path) as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS exams (
@@ -80,6 +399,14 @@ def init_db(db_path: str = None):
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
 
+            -- Separate file: no cross-database FK, delete_exam cleans up
+            CREATE TABLE IF NOT EXISTS blobs.exam_blobs (
+                exam_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                data TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (exam_id, kind)
+            );
+
             CREATE TABLE IF NOT EXISTS questions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 exam_id INTEGER NOT NULL,
@@ -100,7 +427,7 @@ def init_db(db_path: str = None):
                 question_id INTEGER NOT NULL,
                 option_key TEXT NOT NULL,
                 option_text TEXT DEFAULT '',
-                is_correct INTEGER DEFAULT 0,
+                is_correct INTEGER DEFAULT 0 CHECK (is_correct IN (0, 1)),
                 FOREIGN KEY(question_id) REFERENCES questions(id) ON DELETE CASCADE
             );
 
@@ -114,6 +441,8 @@ def init_db(db_path: str = None):
                 FOREIGN KEY(question_id) REFERENCES questions(id) ON DELETE CASCADE
             );
 
+            CREATE INDEX IF NOT EXISTS idx_exams_file_hash
+                ON exams(file_hash);
             CREATE INDEX IF NOT EXISTS idx_questions_exam_id
                 ON questions(exam_id);
             CREATE INDEX IF NOT EXISTS idx_questions_exam_number
@@ -122,8 +451,11 @@ def init_db(db_path: str = None):
                 ON options(question_id);
             CREATE INDEX IF NOT EXISTS idx_images_question_id
                 ON question_images(question_id);
-            CREATE INDEX IF NOT EXISTS idx_images_section
-                ON question_images(question_id, section);
+            CREATE INDEX IF NOT EXISTS idx_images_qsection_order
+                ON question_images(question_id, section, block_order,
+                                   image_path, option_key);
+            CREATE INDEX IF NOT EXISTS idx_images_qid_path
+                ON question_images(question_id, image_path);
         """)
 
     # ── Migrations for existing databases ────────────────────────────
@@ -133,12 +465,19 @@ def init_db(db_path: str = None):
 
 
 def _migrate_add_columns(db_path: str = None):
-    """Add columns that may be missing in older databases."""
+    """
+    Add columns that may be missing in older databases.
+    Skipped once PRAGMA user_version records the current schema version.
+    """
     db_path = db_path or get_db_path()
     with get_connection(db_path) as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+
         # Read existing columns
         cols = {
-            row["name"]
+            row[1]  # name
             for row in conn.execute("PRAGMA table_info(exams)").fetchall()
         }
         if "job_id" not in cols:
@@ -169,6 +508,26 @@ def _migrate_add_columns(db_path: str = None):
                 "ALTER TABLE exams ADD COLUMN validation_json TEXT DEFAULT ''")
             logger.info("Migrated: added exams.validation_json")
 
+        # The unversioned baseline is the only released schema older than
+        # _SCHEMA_VERSION, so the remaining steps upgrade it in one go.
+
+        # Superseded by the covering idx_images_qsection_order
+        conn.execute("DROP INDEX IF EXISTS idx_images_section")
+
+        # Move the JSON blobs out of the exams rows
+        for kind in _BLOB_KINDS:
+            conn.execute(
+                f"""INSERT OR REPLACE INTO blobs.exam_blobs
+                        (exam_id, kind, data)
+                    SELECT id, '{kind}', {kind} FROM exams
+                    WHERE {kind} IS NOT NULL AND {kind} != ''"""
+            )
+        conn.execute(
+            "UPDATE exams SET result_json = '', validation_json = ''")
+        logger.info("Migrated: moved exam JSON blobs to exam_blobs")
+
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
 
 # ─── Exam CRUD ────────────────────────────────────────────────────────────────
 
@@ -191,39 +550,103 @@ def insert_exam(
 ) -> int:
     """Insert a new exam record. Returns the exam_id."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            """INSERT INTO exams
-               (name, file_path, source_pdf, file_hash, file_size_bytes,
-                total_pages, total_questions, provider, version, parser_version,
-                job_id, result_json, original_filename)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        exam_id = _insert_id(
+            conn,
+            _SQL_INSERT_EXAM,
             (name, file_path, source_pdf, file_hash, file_size_bytes,
              total_pages, total_questions, provider, version, parser_version,
-             job_id, result_json, original_filename),
+             job_id, "", original_filename),
         )
-        exam_id = cursor.lastrowid
+        if result_json:
+            conn.execute(
+                _SQL_UPSERT_EXAM_BLOB, (exam_id, "result_json", result_json))
         logger.info(f"Inserted exam id={exam_id} name={name!r}")
         return exam_id
 
 
-def get_exam(exam_id: int, db_path: str = None) -> Optional[dict]:
-    """Fetch a single exam by ID."""
-    with get_connection(db_path) as conn:
+def get_exam(
+    exam_id: int, db_path: str = None, include_blobs: bool = False,
+    kinds: tuple[str, ...] = _BLOB_KINDS,
+) -> Optional[dict]:
+    """
+    Fetch a single exam by ID.
+    The JSON blobs named in ``kinds`` (default: result_json and
+    validation_json) are only loaded with ``include_blobs``.
+    """
+    with get_read_connection(db_path) as conn:
+        row = conn.execute(_SQL_SELECT_EXAM, (exam_id,)).fetchone()
+        if not row:
+            return None
+        exam = dict(row)
+        if include_blobs:
+            _attach_blobs(conn, exam, kinds)
+        return exam
+
+
+def _attach_blobs(
+    conn: sqlite3.Connection, exam: dict,
+    kinds: tuple[str, ...] = _BLOB_KINDS,
+) -> dict:
+    """
+    Fill the given blob kinds on an exam dict from exam_blobs ("" when
+    missing). Only those rows are read, so asking for validation_json
+    alone never loads the much larger result_json.
+    """
+    for kind in kinds:
+        exam[kind] = ""
+    if set(kinds) >= set(_BLOB_KINDS):
+        for row in conn.execute(_SQL_SELECT_EXAM_BLOBS, (exam["id"],)):
+            exam[row["kind"]] = row["data"]
+        return exam
+    for kind in kinds:
         row = conn.execute(
-            "SELECT * FROM exams WHERE id = ?", (exam_id,)
-        ).fetchone()
-        return dict(row) if row else None
+            _SQL_SELECT_EXAM_BLOB, (exam["id"], kind)).fetchone()
+        if row:
+            exam[kind] = row["data"]
+    return exam
 
 
 def list_exams(db_path: str = None) -> list[dict]:
-    """List all exams."""
-    with get_connection(db_path) as conn:
+    """List all exams (summary columns, without the JSON blobs)."""
+    with get_read_connection(db_path) as conn:
         rows = conn.execute(
-            "SELECT * FROM exams ORDER BY created_at DESC"
+            _SQL_LIST_EXAMS
         ).fetchall()
         return [dict(r) for r in rows]
 
 
+def list_exams_summary(
+    exclude_job_ids: set[str] = frozenset(),
+    limit: Optional[int] = None,
+    db_path: str = None,
+) -> list[dict]:
+    """
+    List exams that have a job id, newest first, skipping exclude_job_ids.
+    One query with only the job-list columns; the exclusion runs in SQL
+    unless there are too many ids to bind.
+    """
+    ids = list(exclude_job_ids)
+    sql = _SQL_LIST_EXAMS_SUMMARY
+    params: list = []
+    in_sql = len(ids) <= _MAX_SQL_PARAMS
+    if ids and in_sql:
+        sql += f" AND job_id NOT IN ({','.join('?' * len(ids))})"
+        params.extend(ids)
+    sql += " ORDER BY created_at DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit if in_sql else limit + len(ids))
+    with get_read_connection(db_path) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    result = [dict(r) for r in rows]
+    if not in_sql:
+        excluded = set(ids)
+        result = [r for r in result if r["job_id"] not in excluded]
+        if limit is not None:
+            result = result[:limit]
+    return result
+
+
 def update_exam(exam_id: int, db_path: str = None, **fields) -> bool:
     """Update exam fields. Returns True if row was found."""
     if not fields:
@@ -237,47 +660,91 @@ def update_exam(exam_id: int, db_path: str = None, **fields) -> bool:
     fields = {k: v for k, v in fields.items() if k in allowed}
     if not fields:
         return False
+    blobs = {k: fields.pop(k) for k in _BLOB_KINDS if k in fields}
+
+    with get_connection(db_path) as conn:
+        if fields:
+            keys = tuple(sorted(fields))
+            values = [fields[k] for k in keys] + [exam_id]
+            found = conn.execute(
+                _update_sql("exams", keys), values
+            ).rowcount > 0
+        else:
+            found = conn.execute(
+                _SQL_EXAM_EXISTS, (exam_id,)).fetchone() is not None
+
+        if found and blobs:
+            conn.executemany(
+                _SQL_UPSERT_EXAM_BLOB,
+                [(exam_id, kind, data or "") for kind, data in blobs.items()],
+            )
+        return found
 
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [exam_id]
 
+def update_exam_status(exam_id: int, status: str, db_path: str = None) -> bool:
+    """Set exams.status (fixed statement for the parse hot path)."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            f"UPDATE exams SET {set_clause} WHERE id = ?", values
-        )
-        return cursor.rowcount > 0
+        return conn.execute(
+            _SQL_UPDATE_EXAM_STATUS, (status, exam_id)).rowcount > 0
+
+
+def update_exam_current_page(
+    exam_id: int, current_page: int, db_path: str = None, join: bool = False,
+) -> bool:
+    """
+    Set exams.current_page (fixed statement for page checkpoints).
+    ``join=True`` writes it inside this thread's open batch transaction.
+    """
+    with get_connection(db_path, join=join) as conn:
+        return conn.execute(
+            _SQL_UPDATE_EXAM_CURRENT_PAGE, (current_page, exam_id)
+        ).rowcount > 0
 
 
 def delete_exam(exam_id: int, db_path: str = None) -> bool:
     """Delete an exam and all cascading data. Returns True if row existed."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute("DELETE FROM exams WHERE id = ?", (exam_id,))
+        conn.execute(_SQL_DELETE_EXAM_BLOBS, (exam_id,))
+        cursor = conn.execute(_SQL_DELETE_EXAM, (exam_id,))
         return cursor.rowcount > 0
 
 
-def get_exam_by_job_id(job_id: str, db_path: str = None) -> Optional[dict]:
-    """Fetch a single exam by its API job_id."""
-    with get_connection(db_path) as conn:
+def get_exam_by_job_id(
+    job_id: str, db_path: str = None, kinds: tuple[str, ...] = (),
+) -> Optional[dict]:
+    """
+    Fetch a single exam by its API job_id, with the JSON blobs named in
+    ``kinds`` (none by default).
+    """
+    with get_read_connection(db_path) as conn:
+        row = conn.execute(
+            _SQL_SELECT_EXAM_BY_JOB_ID, (job_id,)
+        ).fetchone()
+        return _attach_blobs(conn, dict(row), kinds) if row else None
+
+
+def find_exam_by_hash(file_hash: str, db_path: str = None) -> Optional[dict]:
+    """Fetch the most recent exam whose source PDF has the given hash."""
+    if not file_hash:
+        return None
+    with get_read_connection(db_path) as conn:
         row = conn.execute(
-            "SELECT * FROM exams WHERE job_id = ?", (job_id,)
+            _SQL_SELECT_EXAM_BY_HASH,
+            (file_hash,),
         ).fetchone()
         return dict(row) if row else None
 
 
 def update_exam_result_json(exam_id: int, result_json: str, db_path: str = None):
     """Store the full result JSON blob for an exam."""
-    with get_connection(db_path) as conn:
-        conn.execute(
-            "UPDATE exams SET result_json = ? WHERE id = ?",
-            (result_json, exam_id),
-        )
+    update_exam(exam_id, db_path=db_path, result_json=result_json)
 
 
 def count_exam_questions(exam_id: int, db_path: str = None) -> int:
     """Return the count of questions stored in DB for an exam."""
-    with get_connection(db_path) as conn:
+    with get_read_connection(db_path) as conn:
         row = conn.execute(
-            "SELECT COUNT(*) as cnt FROM questions WHERE exam_id = ?",
+            _SQL_COUNT_EXAM_QUESTIONS,
             (exam_id,),
         ).fetchone()
         return row["cnt"] if row else 0
@@ -291,12 +758,15 @@ def delete_questions_for_page_range(
 ):
     """
     Delete all questions with page_start >= from_page for an exam.
-    CASCADE will handle options and images.
+    Options and images are deleted first with set-based statements, so
+    the final delete has no children left to CASCADE through row by row.
     Used on resume to clean up partially-saved page data.
     """
     with get_connection(db_path) as conn:
+        conn.execute(_SQL_DELETE_OPTIONS_FROM_PAGE, (exam_id, from_page))
+        conn.execute(_SQL_DELETE_IMAGES_FROM_PAGE, (exam_id, from_page))
         cursor = conn.execute(
-            "DELETE FROM questions WHERE exam_id = ? AND page_start >= ?",
+            _SQL_DELETE_QUESTIONS_FROM_PAGE,
             (exam_id, from_page),
         )
         if cursor.rowcount > 0:
@@ -316,90 +786,147 @@ def delete_question_by_exam_and_number(
     """
     with get_connection(db_path) as conn:
         cursor = conn.execute(
-            "DELETE FROM questions WHERE exam_id = ? AND question_number = ?",
+            _SQL_DELETE_QUESTION_BY_NUMBER,
             (exam_id, question_number),
         )
         return cursor.rowcount > 0
 
 
+def _option_params(question_id: int, q: dict) -> Iterator[tuple]:
+    """Yield options rows for a question dict."""
+    for opt in q.get("options", []):
+        yield (
+            question_id,
+            opt.get("key", ""),
+            opt.get("text", ""),
+            bool(opt.get("is_correct")),
+        )
+
+
+def _image_params(question_id: int, q: dict) -> Iterator[tuple]:
+    """Yield question_images rows for every section of a question dict."""
+    option_images = (
+        (question_id, "option", opt.get("key", ""), img_path, idx)
+        for opt in q.get("options", [])
+        for idx, img_path in enumerate(opt.get("images", []))
+    )
+    section_images = (
+        (question_id, section, None, img_path, idx)
+        for section in ("question", "answer", "explanation")
+        for idx, img_path in enumerate(q.get(f"{section}_images", []))
+    )
+    return itertools.chain(option_images, section_images)
+
+
 def insert_single_question(exam_id: int, q: dict, db_path: str = None) -> int:
     """
     Insert a single question with its options and images.
-    Each call opens/commits/closes its own connection (page-level checkpoint).
+    Commits on return unless called inside an open transaction.
     Returns the new question_id.
     """
     with get_connection(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """INSERT INTO questions
-               (exam_id, question_number, question_type, question_text,
-                answer_text, explanation_text, page_start, page_end, raw_text)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                exam_id,
-                q.get("question_number", 0),
-                q.get("question_type", "mcq"),
-                q.get("question_text", ""),
-                q.get("answer_text", ""),
-                q.get("explanation_text", ""),
-                q.get("page_start", 0),
-                q.get("page_end", 0),
-                q.get("raw_text", ""),
-            ),
-        )
-        question_id = cursor.lastrowid
-
-        # Insert options
-        for opt in q.get("options", []):
-            cursor.execute(
-                """INSERT INTO options
-                   (question_id, option_key, option_text, is_correct)
-                   VALUES (?, ?, ?, ?)""",
-                (
-                    question_id,
-                    opt.get("key", ""),
-                    opt.get("text", ""),
-                    1 if opt.get("is_correct", False) else 0,
-                ),
-            )
-            # Insert option images
-            for idx, img_path in enumerate(opt.get("images", [])):
-                cursor.execute(
-                    """INSERT INTO question_images
-                       (question_id, section, option_key, image_path, block_order)
-                       VALUES (?, 'option', ?, ?, ?)""",
-                    (question_id, opt.get("key", ""), img_path, idx),
-                )
-
-        # Insert question images
-        for idx, img_path in enumerate(q.get("question_images", [])):
-            cursor.execute(
-                """INSERT INTO question_images
-                   (question_id, section, option_key, image_path, block_order)
-                   VALUES (?, 'question', NULL, ?, ?)""",
-                (question_id, img_path, idx),
-            )
+        return _insert_question_rows(conn, exam_id, q)
 
-        # Insert answer images
-        for idx, img_path in enumerate(q.get("answer_images", [])):
-            cursor.execute(
-                """INSERT INTO question_images
-                   (question_id, section, option_key, image_path, block_order)
-                   VALUES (?, 'answer', NULL, ?, ?)""",
-                (question_id, img_path, idx),
-            )
 
-        # Insert explanation images
-        for idx, img_path in enumerate(q.get("explanation_images", [])):
-            cursor.execute(
-                """INSERT INTO question_images
-                   (question_id, section, option_key, image_path, block_order)
-                   VALUES (?, 'explanation', NULL, ?, ?)""",
-                (question_id, img_path, idx),
-            )
+def _insert_question_rows(conn: sqlite3.Connection, exam_id: int, q: dict) -> int:
+    """
+    Insert one question dict with its options and images (no commit).
+    Uses one cursor for all three statements and skips empty batches.
+    """
+    cursor = conn.cursor()
+    question_id = _insert_id(
+        cursor,
+        _SQL_INSERT_QUESTION,
+        (
+            exam_id,
+            q.get("question_number", 0),
+            q.get("question_type", "mcq"),
+            q.get("question_text", ""),
+            q.get("answer_text", ""),
+            q.get("explanation_text", ""),
+            q.get("page_start", 0),
+            q.get("page_end", 0),
+            q.get("raw_text", ""),
+        ),
+    )
+
+    opt_params = list(_option_params(question_id, q))
+    if opt_params:
+        cursor.executemany(_SQL_INSERT_OPTION, opt_params)
+    img_params = list(_image_params(question_id, q))
+    if img_params:
+        cursor.executemany(_SQL_INSERT_IMAGE, img_params)
+    return question_id
+
+
+class QuestionBatchWriter:
+    """
+    Buffered question writer for page-level checkpointing.
+
+    ``add()`` writes a question inside an open transaction without
+    committing; ``checkpoint()`` commits everything added since the last
+    checkpoint and ``rollback()`` discards it. While the batch is open,
+    other database helpers on the same thread only write inside it when
+    called with ``join=True`` (e.g. ``update_exam_current_page``), so a
+    page's questions and its checkpoint commit together; any other
+    ``get_connection`` use raises instead of joining unnoticed.
+
+    Bound to the thread that uses it (it writes on that thread's cached
+    connection).
+    """
 
+    def __init__(self, exam_id: int, db_path: str = None):
+        self.exam_id = exam_id
+        self.db_path = db_path or get_db_path()
+        self.pending = 0
+
+    def _begin(self) -> sqlite3.Connection:
+        conn = _get_conn(self.db_path)
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        return conn
+
+    def add(self, q: dict) -> int:
+        """
+        Replace any question with the same number, then insert ``q``.
+        Returns the new question_id.
+        """
+        conn = self._begin()
+        conn.execute(
+            _SQL_DELETE_QUESTION_BY_NUMBER,
+            (self.exam_id, q.get("question_number", 0)),
+        )
+        question_id = _insert_question_rows(conn, self.exam_id, q)
+        self.pending += 1
         return question_id
 
+    def begin(self):
+        """Open the batch transaction without writing a question yet."""
+        self._begin()
+
+    def checkpoint(self):
+        """Commit everything written since the last checkpoint."""
+        conn = _get_conn(self.db_path)
+        if conn.in_transaction:
+            conn.execute("COMMIT")
+        self.pending = 0
+
+    def rollback(self):
+        """Discard everything written since the last checkpoint."""
+        conn = _get_conn(self.db_path)
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        self.pending = 0
+
+    def __enter__(self) -> "QuestionBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.checkpoint()
+        else:
+            self.rollback()
+
 
 # ─── Question CRUD ────────────────────────────────────────────────────────────
 
@@ -418,119 +945,102 @@ def insert_question(
 ) -> int:
     """Insert a question. Returns question_id."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            """INSERT INTO questions
-               (exam_id, question_number, question_type, question_text,
-                answer_text, explanation_text, page_start, page_end, raw_text)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        return _insert_id(
+            conn,
+            _SQL_INSERT_QUESTION,
             (exam_id, question_number, question_type, question_text,
              answer_text, explanation_text, page_start, page_end, raw_text),
         )
-        return cursor.lastrowid
 
 
-def bulk_insert_questions(exam_id: int, questions: list[dict], db_path: str = None):
+def bulk_insert_questions(
+    exam_id: int,
+    questions: list[dict],
+    db_path: str = None,
+    bulk_mode: bool = False,
+):
     """
     Bulk insert questions with options and images in a single transaction.
     Each dict in `questions` should match ParsedQuestion structure.
-    """
-    db_path = db_path or get_db_path()
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
 
+    Question ids are assigned up front (under the write lock) so options
+    and images can be inserted with one executemany per table.
+
+    ``bulk_mode`` is for loading a freshly created exam: it relaxes
+    synchronous and foreign key checks for the duration of the insert
+    (WAL stays on). Recovery from a crash is re-running the parse.
+    """
+    if not questions:
+        return
+
+    conn = _get_conn(db_path or get_db_path())
+    # These PRAGMAs are ignored inside a transaction, so only an
+    # outermost call can switch them.
+    bulk_mode = bulk_mode and not conn.in_transaction
+    if bulk_mode:
+        conn.executescript("PRAGMA synchronous=OFF; PRAGMA foreign_keys=OFF;")
     try:
-        cursor = conn.cursor()
+        _bulk_insert(exam_id, questions, db_path)
+    finally:
+        if bulk_mode:
+            conn.executescript(
+                "PRAGMA synchronous=NORMAL; PRAGMA foreign_keys=ON;")
+    # Keep the WAL from growing across back-to-back uploads. PASSIVE never
+    # waits on dashboard readers; the WAL is truncated at exit.
+    checkpoint_db(db_path)
 
-        for q in questions:
-            cursor.execute(
-                """INSERT INTO questions
-                   (exam_id, question_number, question_type, question_text,
-                    answer_text, explanation_text, page_start, page_end, raw_text)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    exam_id,
-                    q.get("question_number", 0),
-                    q.get("question_type", "mcq"),
-                    q.get("question_text", ""),
-                    q.get("answer_text", ""),
-                    q.get("explanation_text", ""),
-                    q.get("page_start", 0),
-                    q.get("page_end", 0),
-                    q.get("raw_text", ""),
-                ),
-            )
-            question_id = cursor.lastrowid
-
-            # Insert options
-            for opt in q.get("options", []):
-                cursor.execute(
-                    """INSERT INTO options
-                       (question_id, option_key, option_text, is_correct)
-                       VALUES (?, ?, ?, ?)""",
-                    (
-                        question_id,
-                        opt.get("key", ""),
-                        opt.get("text", ""),
-                        1 if opt.get("is_correct", False) else 0,
-                    ),
-                )
-                option_id = cursor.lastrowid
-
-                # Insert option images
-                for idx, img_path in enumerate(opt.get("images", [])):
-                    cursor.execute(
-                        """INSERT INTO question_images
-                           (question_id, section, option_key, image_path, block_order)
-                           VALUES (?, 'option', ?, ?, ?)""",
-                        (question_id, opt.get("key", ""), img_path, idx),
-                    )
-
-            # Insert question images
-            for idx, img_path in enumerate(q.get("question_images", [])):
-                cursor.execute(
-                    """INSERT INTO question_images
-                       (question_id, section, option_key, image_path, block_order)
-                       VALUES (?, 'question', NULL, ?, ?)""",
-                    (question_id, img_path, idx),
-                )
-
-            # Insert answer images
-            for idx, img_path in enumerate(q.get("answer_images", [])):
-                cursor.execute(
-                    """INSERT INTO question_images
-                       (question_id, section, option_key, image_path, block_order)
-                       VALUES (?, 'answer', NULL, ?, ?)""",
-                    (question_id, img_path, idx),
-                )
-
-            # Insert explanation images
-            for idx, img_path in enumerate(q.get("explanation_images", [])):
-                cursor.execute(
-                    """INSERT INTO question_images
-                       (question_id, section, option_key, image_path, block_order)
-                       VALUES (?, 'explanation', NULL, ?, ?)""",
-                    (question_id, img_path, idx),
-                )
-
-        conn.commit()
-        logger.info(
-            f"Bulk-inserted {len(questions)} questions for exam_id={exam_id}"
-        )
+    logger.info(
+        f"Bulk-inserted {len(questions)} questions for exam_id={exam_id}"
+    )
 
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+def _bulk_insert(exam_id: int, questions: list[dict], db_path: str = None):
+    """Insert body of bulk_insert_questions."""
+    with get_connection(db_path, immediate=True) as conn:
+        row = conn.execute(
+            _SQL_NEXT_QUESTION_ID
+        ).fetchone()
+        next_id = row[0] + 1
+
+        q_rows = []
+        opt_rows = []
+        img_rows = []
+        for question_id, q in enumerate(questions, start=next_id):
+            q_rows.append((
+                question_id,
+                exam_id,
+                q.get("question_number", 0),
+                q.get("question_type", "mcq"),
+                q.get("question_text", ""),
+                q.get("answer_text", ""),
+                q.get("explanation_text", ""),
+                q.get("page_start", 0),
+                q.get("page_end", 0),
+                q.get("raw_text", ""),
+            ))
+
+            opt_rows.extend(_option_params(question_id, q))
+            img_rows.extend(_image_params(question_id, q))
+
+        conn.executemany(
+            _SQL_INSERT_QUESTION_WITH_ID,
+            q_rows,
+        )
+        conn.executemany(
+            _SQL_INSERT_OPTION,
+            opt_rows,
+        )
+        conn.executemany(
+            _SQL_INSERT_IMAGE,
+            img_rows,
+        )
 
 
 def get_question(question_id: int, db_path: str = None) -> Optional[dict]:
     """Fetch a single question with options and images."""
-    with get_connection(db_path) as conn:
+    with get_read_connection(db_path) as conn:
         row = conn.execute(
-            "SELECT * FROM questions WHERE id = ?", (question_id,)
+            _SQL_SELECT_QUESTION, (question_id,)
         ).fetchone()
         if not row:
             return None
@@ -541,10 +1051,9 @@ def get_question_by_number(
     exam_id: int, question_number: int, db_path: str = None
 ) -> Optional[dict]:
     """Fetch a question by exam_id + question_number."""
-    with get_connection(db_path) as conn:
+    with get_read_connection(db_path) as conn:
         row = conn.execute(
-            """SELECT * FROM questions
-               WHERE exam_id = ? AND question_number = ?""",
+            _SQL_SELECT_QUESTION_BY_NUMBER,
             (exam_id, question_number),
         ).fetchone()
         if not row:
@@ -553,15 +1062,40 @@ def get_question_by_number(
 
 
 def get_exam_questions(exam_id: int, db_path: str = None) -> list[dict]:
-    """Fetch all questions for an exam, ordered by question_number."""
-    with get_connection(db_path) as conn:
+    """
+    Fetch all questions for an exam, ordered by question_number.
+    Options and images for the whole exam are loaded with one query each
+    and grouped by question_id, instead of two queries per question.
+    """
+    with get_read_connection(db_path) as conn:
         rows = conn.execute(
-            """SELECT * FROM questions
-               WHERE exam_id = ?
-               ORDER BY question_number""",
+            _SQL_SELECT_EXAM_QUESTIONS,
+            (exam_id,),
+        ).fetchall()
+        # Child rows come back as plain tuples and are unpacked by position
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        opt_rows = cursor.execute(
+            _SQL_SELECT_EXAM_OPTIONS,
+            (exam_id,),
+        ).fetchall()
+        img_rows = cursor.execute(
+            _SQL_SELECT_EXAM_IMAGES,
             (exam_id,),
         ).fetchall()
-        return [_hydrate_question(conn, dict(r)) for r in rows]
+
+    opts_by_question: dict[int, list] = defaultdict(list)
+    for qid, *opt in opt_rows:
+        opts_by_question[qid].append(opt)
+    imgs_by_question: dict[int, list] = defaultdict(list)
+    for qid, *img in img_rows:
+        imgs_by_question[qid].append(img)
+
+    return [
+        _assemble_question(
+            dict(r), opts_by_question[r["id"]], imgs_by_question[r["id"]])
+        for r in rows
+    ]
 
 
 def update_question(question_id: int, db_path: str = None, **fields) -> bool:
@@ -575,12 +1109,12 @@ def update_question(question_id: int, db_path: str = None, **fields) -> bool:
     if not fields:
         return False
 
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [question_id]
+    keys = tuple(sorted(fields))
+    values = [fields[k] for k in keys] + [question_id]
 
     with get_connection(db_path) as conn:
         cursor = conn.execute(
-            f"UPDATE questions SET {set_clause} WHERE id = ?", values
+            _update_sql("questions", keys), values
         )
         return cursor.rowcount > 0
 
@@ -593,13 +1127,13 @@ def delete_question(question_id: int, db_path: str = None) -> list[str]:
     with get_connection(db_path) as conn:
         # Collect image paths first
         rows = conn.execute(
-            "SELECT image_path FROM question_images WHERE question_id = ?",
+            _SQL_SELECT_QUESTION_IMAGE_PATHS,
             (question_id,),
         ).fetchall()
-        image_paths = [r["image_path"] for r in rows]
+        image_paths = [r[0] for r in rows]
 
         # CASCADE will handle options + images
-        conn.execute("DELETE FROM questions WHERE id = ?", (question_id,))
+        conn.execute(_SQL_DELETE_QUESTION, (question_id,))
         return image_paths
 
 
@@ -615,12 +1149,11 @@ def insert_option(
 ) -> int:
     """Insert a new option. Returns option_id."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            """INSERT INTO options (question_id, option_key, option_text, is_correct)
-               VALUES (?, ?, ?, ?)""",
-            (question_id, option_key, option_text, 1 if is_correct else 0),
+        return _insert_id(
+            conn,
+            _SQL_INSERT_OPTION_RETURNING_ID,
+            (question_id, option_key, option_text, bool(is_correct)),
         )
-        return cursor.lastrowid
 
 
 def update_option(option_id: int, db_path: str = None, **fields) -> bool:
@@ -630,16 +1163,16 @@ def update_option(option_id: int, db_path: str = None, **fields) -> bool:
     if not fields:
         return False
 
-    # Convert is_correct to int
+    # Normalise to bool; sqlite3 stores it as 0/1
     if "is_correct" in fields:
-        fields["is_correct"] = 1 if fields["is_correct"] else 0
+        fields["is_correct"] = bool(fields["is_correct"])
 
-    set_clause = ", ".join(f"{k} = ?" for k in fields)
-    values = list(fields.values()) + [option_id]
+    keys = tuple(sorted(fields))
+    values = [fields[k] for k in keys] + [option_id]
 
     with get_connection(db_path) as conn:
         cursor = conn.execute(
-            f"UPDATE options SET {set_clause} WHERE id = ?", values
+            _update_sql("options", keys), values
         )
         return cursor.rowcount > 0
 
@@ -647,7 +1180,7 @@ def update_option(option_id: int, db_path: str = None, **fields) -> bool:
 def delete_option(option_id: int, db_path: str = None) -> bool:
     """Delete an option."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute("DELETE FROM options WHERE id = ?", (option_id,))
+        cursor = conn.execute(_SQL_DELETE_OPTION, (option_id,))
         return cursor.rowcount > 0
 
 
@@ -664,22 +1197,18 @@ def insert_image(
 ) -> int:
     """Insert a new image record. Returns image_id."""
     with get_connection(db_path) as conn:
-        cursor = conn.execute(
-            """INSERT INTO question_images
-               (question_id, section, option_key, image_path, block_order)
-               VALUES (?, ?, ?, ?, ?)""",
+        return _insert_id(
+            conn,
+            _SQL_INSERT_IMAGE_RETURNING_ID,
             (question_id, section, option_key, image_path, block_order),
         )
-        return cursor.lastrowid
 
 
 def get_question_images(question_id: int, db_path: str = None) -> list[dict]:
     """Get all images for a question."""
-    with get_connection(db_path) as conn:
+    with get_read_connection(db_path) as conn:
         rows = conn.execute(
-            """SELECT * FROM question_images
-               WHERE question_id = ?
-               ORDER BY section, block_order""",
+            _SQL_SELECT_QUESTION_IMAGES,
             (question_id,),
         ).fetchall()
         return [dict(r) for r in rows]
@@ -698,16 +1227,16 @@ def update_image(image_id: int, db_path: str = None, **fields) -> Optional[str]:
         old_path = None
         if "image_path" in fields:
             row = conn.execute(
-                "SELECT image_path FROM question_images WHERE id = ?",
+                _SQL_SELECT_IMAGE_PATH,
                 (image_id,),
             ).fetchone()
             if row:
-                old_path = row["image_path"]
+                old_path = row[0]
 
-        set_clause = ", ".join(f"{k} = ?" for k in fields)
-        values = list(fields.values()) + [image_id]
+        keys = tuple(sorted(fields))
+        values = [fields[k] for k in keys] + [image_id]
         conn.execute(
-            f"UPDATE question_images SET {set_clause} WHERE id = ?", values
+            _update_sql("question_images", keys), values
         )
         return old_path
 
@@ -716,30 +1245,48 @@ def delete_image(image_id: int, db_path: str = None) -> Optional[str]:
     """Delete an image record. Returns the image_path for filesystem cleanup."""
     with get_connection(db_path) as conn:
         row = conn.execute(
-            "SELECT image_path FROM question_images WHERE id = ?",
+            _SQL_SELECT_IMAGE_PATH,
             (image_id,),
         ).fetchone()
         if not row:
             return None
 
-        conn.execute("DELETE FROM question_images WHERE id = ?", (image_id,))
-        return row["image_path"]
+        conn.execute(_SQL_DELETE_IMAGE, (image_id,))
+        return row[0]
 
 
 def get_exam_image_paths(exam_id: int, db_path: str = None) -> list[str]:
     """Get all image paths for an exam (for cleanup)."""
-    with get_connection(db_path) as conn:
+    with get_read_connection(db_path) as conn:
         rows = conn.execute(
-            """SELECT qi.image_path
-               FROM question_images qi
-               JOIN questions q ON qi.question_id = q.id
-               WHERE q.exam_id = ?""",
+            _SQL_SELECT_EXAM_IMAGE_PATHS,
             (exam_id,),
         ).fetchall()
         return [r["image_path"] for r in rows]
 
 
-# ─── Helper ──────────────────────────────────────────────────────────────────
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+
+def _insert_id(
+    target: sqlite3.Connection | sqlite3.Cursor, sql: str, params
+) -> int:
+    """Run a single-row INSERT on a connection or cursor; return the row id."""
+    cursor = target.execute(sql, params)
+    if _HAS_RETURNING:
+        return cursor.fetchall()[0][0]
+    return cursor.lastrowid
+
+
+@functools.lru_cache(maxsize=256)
+def _update_sql(table: str, keys: tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for a table and a sorted tuple of columns.
+    Callers sort the keys so that the same column set always produces the
+    same SQL text, letting sqlite3's statement cache reuse the prepared plan.
+    """
+    set_clause = ", ".join(f"{k} = ?" for k in keys)
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
 
 
 def _hydrate_question(conn: sqlite3.Connection, question: dict) -> dict:
@@ -747,57 +1294,64 @@ def _hydrate_question(conn: sqlite3.Connection, question: dict) -> dict:
     Enrich a question dict with its options and images.
     Produces the exact structure the UI expects:
         question_text, question_images, options[], answer_text,
-        explanation_text, explanation_images
+        explanation_text, explanation_images, image_count
     """
     qid = question["id"]
+    cursor = conn.cursor()
+    cursor.row_factory = None
 
     # Fetch options
-    opt_rows = conn.execute(
-        """SELECT * FROM options
-           WHERE question_id = ? ORDER BY option_key""",
+    opt_rows = cursor.execute(
+        _SQL_SELECT_QUESTION_OPTIONS,
         (qid,),
     ).fetchall()
 
     # Fetch images grouped by section
-    img_rows = conn.execute(
-        """SELECT * FROM question_images
-           WHERE question_id = ? ORDER BY section, block_order""",
+    img_rows = cursor.execute(
+        _SQL_HYDRATE_QUESTION_IMAGES,
         (qid,),
     ).fetchall()
 
-    # Sort images into buckets
-    question_images = []
-    answer_images = []
-    explanation_images = []
-    option_images: dict[str, list[str]] = {}
-
-    for img in img_rows:
-        path = img["image_path"]
-        sec = img["section"]
-        if sec == "question":
-            question_images.append(path)
-        elif sec == "answer":
-            answer_images.append(path)
-        elif sec == "explanation":
-            explanation_images.append(path)
-        elif sec == "option":
-            key = img["option_key"] or ""
-            option_images.setdefault(key, []).append(path)
+    return _assemble_question(question, opt_rows, img_rows)
+
+
+def _assemble_question(question: dict, opt_rows: list, img_rows: list) -> dict:
+    """
+    Attach already-fetched option and image rows to a question dict.
+    Option rows are (option_key, option_text, is_correct) ordered by key;
+    image rows are (section, option_key, image_path) ordered by
+    (section, block_order).
+    """
+    # Sort images into buckets in one pass: section -> list, with option
+    # images further keyed by option_key
+    buckets: dict[str, list[str]] = {
+        "question": [], "answer": [], "explanation": [],
+    }
+    option_images: defaultdict[str, list[str]] = defaultdict(list)
+
+    for sec, option_key, path in img_rows:
+        if sec == "option":
+            option_images[option_key or ""].append(path)
+        else:
+            bucket = buckets.get(sec)
+            if bucket is not None:
+                bucket.append(path)
 
     # Build options list
-    options = []
-    for opt in opt_rows:
-        key = opt["option_key"]
-        options.append({
+    options = [
+        {
             "key": key,
-            "text": opt["option_text"],
-            "is_correct": bool(opt["is_correct"]),
+            "text": text,
+            "is_correct": bool(is_correct),
             "images": option_images.get(key, []),
-        })
+        }
+        for key, text, is_correct in opt_rows
+    ]
 
-    question["question_images"] = question_images
-    question["answer_images"] = answer_images
-    question["explanation_images"] = explanation_images
+    question["question_images"] = buckets["question"]
+    question["answer_images"] = buckets["answer"]
+    question["explanation_images"] = buckets["explanation"]
     question["options"] = options
+    question["image_count"] = len(img_rows)
 
     return question
@@ -16,18 +16,25 @@ Architecture:
 
 from __future__ import annotations
 
-import hashlib
-import json
+import gzip
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from pydantic_core import to_json
+
 from . import __version__
+from . import storage
 from .block_extractor import BlockExtractor
 from .models import (
+    CONTENT_BLOCK_ADAPTER,
+    PARSE_RESULT_ADAPTER,
+    VALIDATION_REPORT_ADAPTER,
     ExamMetadata,
     ParseResult,
     ParseVersion,
@@ -38,6 +45,25 @@ from .validator import ValidationEngine
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for the streamed raw blocks snapshot
+_RAW_BLOCKS_BUFFER = 4 * 1024 * 1024
+
+
+class _CleanNameTable(dict):
+    """
+    str.translate() table for exam IDs: keeps alphanumerics, '-' and '_',
+    maps everything else to '_'. Entries are filled in on first sight, so
+    the Unicode-aware isalnum() behaviour is preserved.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        self[codepoint] = ch if ch.isalnum() or ch in "-_" else "_"
+        return self[codepoint]
+
+
+_CLEAN_NAME_TABLE = _CleanNameTable()
+
 
 @dataclass
 class ParserConfig:
@@ -51,6 +77,7 @@ class ParserConfig:
     # Output settings
     output_dir: str = "output"
     image_base_dir: str = "storage/questions"
+    pretty_json: bool = False  # Indent saved JSON files for humans
 
     # Exam metadata
     exam_name: str = ""
@@ -68,6 +95,9 @@ class ParserConfig:
     # Version tracking
     save_raw_blocks: bool = True
     save_snapshots: bool = True
+    # Opt-in: gzip raw block snapshots with more blocks than this, saved
+    # as *_raw_blocks.json.gz instead of *_raw_blocks.json (0 = never)
+    raw_blocks_gzip_threshold: int = 0
 
 
 class ParserEngine:
@@ -107,8 +137,12 @@ class ParserEngine:
             console.setFormatter(formatter)
             parser_logger.addHandler(console)
 
-        # File handler
-        if self.config.log_file:
+        # File handler (once per file: engines are built per PDF)
+        if self.config.log_file and not any(
+            isinstance(h, logging.FileHandler)
+            and h.baseFilename == os.path.abspath(self.config.log_file)
+            for h in parser_logger.handlers
+        ):
             log_dir = Path(self.config.log_file).parent
             log_dir.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(
@@ -146,9 +180,13 @@ class ParserEngine:
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
         start_time = time.time()
-        logger.info(f"Starting parse of: {pdf_path}")
+        logger.info("Starting parse of: %s", pdf_path)
 
         # ── Step 1: Compute file metadata ─────────────────────────────
+        # Hashing is disk-bound; let it run alongside block extraction
+        hash_pool = ThreadPoolExecutor(max_workers=1)
+        hash_future = hash_pool.submit(self._compute_file_hash, pdf_path)
+        hash_pool.shutdown(wait=False)
         exam_metadata = self._build_exam_metadata(pdf_path)
 
         # ── Step 2: Setup image output directory ──────────────────────
@@ -171,7 +209,8 @@ class ParserEngine:
             progress_callback=progress_callback,
         )
 
-        exam_metadata.total_pages = extractor.get_page_count(pdf_path)
+        # extract() already had the document open; don't reopen it to count
+        exam_metadata.total_pages = extractor.last_page_count
 
         # ── Step 4: State machine parsing ─────────────────────────────
         logger.info("Phase 2: State machine parsing")
@@ -184,6 +223,7 @@ class ParserEngine:
         validation = validator.validate(questions)
 
         # ── Step 6: Build result ──────────────────────────────────────
+        exam_metadata.file_hash = hash_future.result()
         parse_version = ParseVersion(
             parser_version=__version__,
             raw_block_count=len(blocks),
@@ -199,88 +239,128 @@ class ParserEngine:
 
         elapsed = time.time() - start_time
         logger.info(
-            f"Parse complete in {elapsed:.2f}s — "
-            f"{len(questions)} questions extracted"
+            "Parse complete in %.2fs — %d questions extracted",
+            elapsed, len(questions),
         )
 
         # ── Step 7: Save output ───────────────────────────────────────
         output_dir = Path(self.config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save main JSON output
-        output_file = output_dir / f"{exam_id}_parsed.json"
-        self._save_json(result, output_file)
-
-        # Save raw blocks snapshot if enabled
-        if self.config.save_raw_blocks:
-            raw_file = output_dir / f"{exam_id}_raw_blocks.json"
-            self._save_raw_blocks(blocks, raw_file)
+        # Serialized once; embedded in the main output and saved on its own
+        validation_data = VALIDATION_REPORT_ADAPTER.dump_python(
+            validation, mode="json")
+
+        # The files are independent, so serialize and write them together
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Save main JSON output
+            output_file = output_dir / f"{exam_id}_parsed.json"
+            futures = [pool.submit(
+                self._save_json, result, output_file, validation_data)]
+
+            # Save raw blocks snapshot if enabled
+            if self.config.save_raw_blocks:
+                raw_file = output_dir / f"{exam_id}_raw_blocks.json"
+                futures.append(
+                    pool.submit(self._save_raw_blocks, blocks, raw_file)
+                )
+
+            # Save validation report
+            report_file = output_dir / f"{exam_id}_validation.json"
+            futures.append(
+                pool.submit(self._save_report, validation_data, report_file)
+            )
 
-        # Save validation report
-        report_file = output_dir / f"{exam_id}_validation.json"
-        self._save_json_dict(validation.model_dump(), report_file)
+            for future in futures:
+                future.result()
 
-        logger.info(f"Output saved to: {output_dir}")
+        logger.info("Output saved to: %s", output_dir)
 
         return result
 
     def _build_exam_metadata(self, pdf_path: str) -> ExamMetadata:
-        """Build exam metadata from file info and config."""
+        """
+        Build exam metadata from file info and config.
+        file_hash is filled in by parse() once the background hash is done.
+        """
         file_size = os.path.getsize(pdf_path)
-        file_hash = self._compute_file_hash(pdf_path)
 
         return ExamMetadata(
             name=self.config.exam_name or Path(pdf_path).stem,
             provider=self.config.exam_provider,
             version=self.config.exam_version,
             source_pdf=os.path.basename(pdf_path),
-            file_hash=file_hash,
             file_size_bytes=file_size,
         )
 
     def _compute_file_hash(self, filepath: str) -> str:
         """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return storage.compute_file_hash(filepath)
 
     def _generate_exam_id(self, pdf_path: str) -> str:
         """Generate a deterministic exam ID from file path and hash."""
         name = Path(pdf_path).stem
         # Clean the name for filesystem use
-        clean_name = "".join(
-            c if c.isalnum() or c in "-_" else "_"
-            for c in name
-        )
-        return clean_name[:50]
+        return name[:50].translate(_CLEAN_NAME_TABLE)
+
+    @property
+    def _json_indent(self) -> Optional[int]:
+        """Compact JSON unless pretty output was requested."""
+        return 2 if self.config.pretty_json else None
 
-    def _save_json(self, result: ParseResult, filepath: Path):
-        """Save ParseResult to JSON file."""
+    def _save_json(
+        self,
+        result: ParseResult,
+        filepath: Path,
+        validation_data: dict,
+    ):
+        """
+        Save ParseResult to JSON file.
+        The validation report dumped by parse() is reused instead of
+        serializing ``result.validation`` a second time.
+        """
         try:
-            data = result.model_dump()
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            logger.info(f"Saved JSON output: {filepath}")
+            data = PARSE_RESULT_ADAPTER.dump_python(
+                result, mode="json", exclude={"validation"})
+            data["validation"] = validation_data
+            filepath.write_bytes(to_json(data, indent=self._json_indent))
+            logger.info("Saved JSON output: %s", filepath)
         except Exception as e:
-            logger.error(f"Failed to save JSON: {e}")
+            logger.error("Failed to save JSON: %s", e)
 
-    def _save_json_dict(self, data: dict, filepath: Path):
-        """Save a dict to JSON file."""
+    def _save_report(self, validation_data: dict, filepath: Path):
+        """Save the serialized validation report."""
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            logger.info(f"Saved JSON: {filepath}")
+            filepath.write_bytes(
+                to_json(validation_data, indent=self._json_indent))
+            logger.info("Saved JSON: %s", filepath)
         except Exception as e:
-            logger.error(f"Failed to save JSON: {e}")
+            logger.error("Failed to save JSON: %s", e)
 
     def _save_raw_blocks(self, blocks: list, filepath: Path):
-        """Save raw extracted blocks snapshot."""
+        """
+        Save raw extracted blocks snapshot.
+        Streams one block at a time, one per line, so only a single
+        block's JSON is held in memory. When ``raw_blocks_gzip_threshold``
+        is set, larger snapshots are written gzipped and the ``.gz``
+        suffix is appended to the file name.
+        """
+        indent = self._json_indent
+        threshold = self.config.raw_blocks_gzip_threshold
+        compress = 0 < threshold < len(blocks)
+        if compress:
+            filepath = filepath.with_name(filepath.name + ".gz")
         try:
-            data = [b.model_dump() for b in blocks]
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            logger.info(f"Saved raw blocks snapshot: {filepath}")
+            # A large buffer turns the per-block writes into few syscalls
+            with open(filepath, "wb", buffering=_RAW_BLOCKS_BUFFER) as raw, (
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=3)
+                if compress else nullcontext(raw)
+            ) as f:
+                f.write(b"[")
+                for i, block in enumerate(blocks):
+                    f.write(b"\n" if i == 0 else b",\n")
+                    f.write(CONTENT_BLOCK_ADAPTER.dump_json(block, indent=indent))
+                f.write(b"\n]\n" if blocks else b"]\n")
+            logger.info("Saved raw blocks snapshot: %s", filepath)
         except Exception as e:
-            logger.error(f"Failed to save raw blocks: {e}")
+            logger.error("Failed to save raw blocks: %s", e)
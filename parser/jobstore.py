@@ -0,0 +1,254 @@
+"""
+Job Store
+=========
+In-process registry of parse jobs for the HTTP service.
+
+Each job is one flat record (dict). The store keeps a batch_id -> job ids
+index, the set of active (queued/processing) jobs and per-status counts, so
+the common lookups never scan every job. Reads share a read/write lock.
+
+Job state is per-process; the server mirrors records to disk for other
+workers and restarts (see server._save_job_record).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional
+
+_ACTIVE_STATUSES = ("queued", "processing")
+
+
+class _RWLock:
+    """
+    Many readers or one writer. Waiting writers hold off new readers so a
+    steady stream of status polls can't starve job updates. Not reentrant.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class JobStore:
+    """
+    Registry of parse jobs, one flat record (dict) per job id.
+
+    Records are never handed out live: get() and the listing methods return
+    shallow copies, and writers go through create()/update().
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, dict] = {}
+        self._batches: dict[str, set[str]] = {}
+        self._active: set[str] = set()
+        self._status_counts: Counter = Counter()
+        self._lock = _RWLock()
+        # Bumped on every write; watch() waits on it
+        self._version = 0
+        self._changed = threading.Condition()
+
+    def _notify(self):
+        with self._changed:
+            self._version += 1
+            self._changed.notify_all()
+
+    def create(self, job: dict):
+        """Register a new job record (must carry an "id")."""
+        self.create_many([job])
+
+    def create_many(self, new_jobs: list[dict]):
+        """Register several job records under a single lock acquisition."""
+        with self._lock.write():
+            for job in new_jobs:
+                old = self._jobs.get(job["id"])
+                if old is not None:
+                    self._status_counts[old["status"]] -= 1
+                self._jobs[job["id"]] = job
+                self._set_status(job["id"], job["status"])
+                batch_id = job.get("batch_id")
+                if batch_id:
+                    self._batches.setdefault(batch_id, set()).add(job["id"])
+        self._notify()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Snapshot of one job, or None."""
+        with self._lock.read():
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def update(self, job_id: str, **fields) -> bool:
+        """Set fields on a job. Returns False if the job is gone."""
+        with self._lock.write():
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            if "status" in fields and fields["status"] != job["status"]:
+                self._status_counts[job["status"]] -= 1
+                self._set_status(job_id, fields["status"])
+            job.update(fields)
+        self._notify()
+        return True
+
+    def set_progress(self, job_id: str, progress: float):
+        """
+        Progress write for the per-page hot path. Skips the store lock: a
+        single dict item assignment is atomic under the GIL and a stale read
+        is harmless. Watchers are woken only when the value changes, which
+        with whole-percent progress is at most ~100 times per job.
+        """
+        job = self._jobs.get(job_id)
+        if job is not None and job["progress"] != progress:
+            job["progress"] = progress
+            self._notify()
+
+    def delete(self, job_id: str) -> bool:
+        """Drop a job. Returns False if it wasn't there."""
+        with self._lock.write():
+            removed = self._pop(job_id) is not None
+        self._notify()
+        return removed
+
+    def watch(self, job_id: str, last: Optional[tuple],
+              timeout: float) -> Optional[dict]:
+        """
+        Wait until the job's (status, progress) differs from `last` or the
+        timeout passes, then return a snapshot. None if the job is gone.
+        """
+        if last is not None:
+            changed = self.watch_many([job_id], {job_id: last}, timeout)
+            if job_id in changed:
+                return changed[job_id]
+        return self.get(job_id)
+
+    def watch_many(self, job_ids: list[str], last: dict[str, tuple],
+                   timeout: float) -> dict[str, Optional[dict]]:
+        """
+        Wait until any of the jobs' (status, progress) differs from its
+        entry in `last` (missing entries count as changed) or the timeout
+        passes. Returns {job_id: snapshot} for the jobs that changed, with
+        None for jobs no longer in the store; empty on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._changed:
+                seen = self._version
+            changed = {}
+            with self._lock.read():
+                for job_id in job_ids:
+                    job = self._jobs.get(job_id)
+                    if job is None:
+                        changed[job_id] = None
+                    elif (job["status"], job["progress"]) != last.get(job_id):
+                        changed[job_id] = dict(job)
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            with self._changed:
+                if self._version == seen:
+                    self._changed.wait(remaining)
+
+    def prune(self, retention: float, max_jobs: int) -> list[dict]:
+        """
+        Evict finished jobs that completed more than `retention` seconds ago,
+        then the oldest remaining finished jobs while the store holds more
+        than `max_jobs`. Queued/processing jobs are never evicted.
+        Returns the evicted records.
+        """
+        cutoff = time.time() - retention
+        with self._lock.write():
+            expired, kept = [], []
+            for job_id, job in self._jobs.items():
+                if job["status"] not in ("completed", "failed"):
+                    continue
+                if (job["completed_at"] or 0) < cutoff:
+                    expired.append(job_id)
+                else:
+                    kept.append(job_id)
+            overflow = len(self._jobs) - len(expired) - max_jobs
+            if overflow > 0:
+                kept.sort(key=lambda jid: self._jobs[jid]["completed_at"] or 0)
+                expired.extend(kept[:overflow])
+            evicted = [self._pop(job_id) for job_id in expired]
+        if evicted:
+            self._notify()
+        return evicted
+
+    def _set_status(self, job_id: str, status: str):
+        """Count a job under its new status. Caller holds the write lock."""
+        self._status_counts[status] += 1
+        if status in _ACTIVE_STATUSES:
+            self._active.add(job_id)
+        else:
+            self._active.discard(job_id)
+
+    def _pop(self, job_id: str) -> Optional[dict]:
+        """Remove a job and its index entries. Caller holds the lock."""
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        self._status_counts[job["status"]] -= 1
+        self._active.discard(job_id)
+        batch_id = job.get("batch_id")
+        if batch_id in self._batches:
+            self._batches[batch_id].discard(job_id)
+            if not self._batches[batch_id]:
+                del self._batches[batch_id]
+        return job
+
+    def batch(self, batch_id: str) -> list[dict]:
+        """Snapshots of the jobs in a batch."""
+        with self._lock.read():
+            return [
+                dict(self._jobs[jid])
+                for jid in self._batches.get(batch_id, ())
+            ]
+
+    def list_active(self) -> list[dict]:
+        """Snapshots of queued and processing jobs."""
+        with self._lock.read():
+            return [dict(self._jobs[jid]) for jid in self._active]
+
+    def status_counts(self) -> dict[str, int]:
+        """Number of jobs in each status."""
+        with self._lock.read():
+            return {k: v for k, v in self._status_counts.items() if v}
+
+    def all(self) -> list[dict]:
+        """Snapshots of every job."""
+        with self._lock.read():
+            return [dict(job) for job in self._jobs.values()]
@@ -7,12 +7,18 @@ All models are serializable to JSON for Laravel consumption.
 
 from __future__ import annotations
 
-import hashlib
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    field_serializer,
+)
 
 
 # ─── Enums ────────────────────────────────────────────────────────────────────
@@ -83,11 +89,9 @@ class ContentBlock(BaseModel):
     )
     font_info: Optional[FontInfo] = None
 
-    def model_dump(self, **kwargs):
-        data = super().model_dump(**kwargs)
-        if "bbox" in data and isinstance(data["bbox"], tuple):
-            data["bbox"] = list(data["bbox"])
-        return data
+    @field_serializer("bbox")
+    def _serialize_bbox(self, bbox: tuple) -> list[float]:
+        return list(bbox)
 
 
 class FontInfo(BaseModel):
@@ -159,32 +163,65 @@ class ParsedQuestion(BaseModel):
         description="Full raw text for debug"
     )
 
+    # Derived values frozen by finalize(); empty while the question is built
+    _derived: dict = PrivateAttr(default_factory=dict)
+    # Running severity total, kept in step by add_anomaly()
+    _anomaly_total: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context):
+        self._anomaly_total = sum(a.severity for a in self.anomalies)
+
+    def add_anomaly(self, anomaly: Anomaly):
+        """Record an anomaly and fold its severity into the score."""
+        self.anomalies.append(anomaly)
+        self._anomaly_total += anomaly.severity
+
+    def finalize(self):
+        """
+        Freeze the content-derived flags once the parser is done with this
+        question, so every dump and validation pass reuses them.
+        Call again if the question's content is edited afterwards.
+        """
+        self._derived = {}
+        self._derived = {
+            "has_question_text": self.has_question_text,
+            "has_answer": self.has_answer,
+            "has_explanation": self.has_explanation,
+            "image_count": self.image_count,
+        }
+
     @computed_field
     @property
     def anomaly_score(self) -> int:
         """Aggregate anomaly score (0-100)."""
-        if not self.anomalies:
-            return 0
-        return min(100, sum(a.severity for a in self.anomalies))
+        return min(100, self._anomaly_total)
 
     @computed_field
     @property
     def has_question_text(self) -> bool:
+        if "has_question_text" in self._derived:
+            return self._derived["has_question_text"]
         return bool(self.question_text.strip())
 
     @computed_field
     @property
     def has_answer(self) -> bool:
+        if "has_answer" in self._derived:
+            return self._derived["has_answer"]
         return bool(self.answer_text.strip())
 
     @computed_field
     @property
     def has_explanation(self) -> bool:
+        if "has_explanation" in self._derived:
+            return self._derived["has_explanation"]
         return bool(self.explanation_text.strip())
 
     @computed_field
     @property
     def image_count(self) -> int:
+        if "image_count" in self._derived:
+            return self._derived["image_count"]
         count = len(self.question_images) + len(self.answer_images) + len(self.explanation_images)
         for opt in self.options:
             count += len(opt.images)
@@ -252,8 +289,14 @@ class ParseResult(BaseModel):
 
     def compute_file_hash(self, filepath: str) -> str:
         """Compute SHA-256 hash of source file."""
-        sha256 = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        from .storage import compute_file_hash
+        return compute_file_hash(filepath)
+
+
+# ─── Serializers ─────────────────────────────────────────────────────────────
+# Shared adapters whose dump_json() returns UTF-8 bytes directly, skipping the
+# str round-trip of model_dump_json().encode().
+
+PARSE_RESULT_ADAPTER = TypeAdapter(ParseResult)
+VALIDATION_REPORT_ADAPTER = TypeAdapter(ValidationReport)
+CONTENT_BLOCK_ADAPTER = TypeAdapter(ContentBlock)
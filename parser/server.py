@@ -21,23 +21,45 @@ Endpoints:
 
 from __future__ import annotations
 
+import atexit
+import dataclasses
+import hashlib
 import json
 import logging
+import mimetypes
 import os
+import queue
+import shutil
+import tempfile
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 from urllib.parse import urlparse
 
-from flask import Flask, jsonify, request, render_template, send_from_directory
+from flask import (
+    Flask, Request, Response, abort, current_app, jsonify, request,
+    render_template, send_file, send_from_directory,
+)
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.security import safe_join
+from werkzeug.utils import secure_filename
 
-from .engine import ParserConfig, ParserEngine
+from .engine import ParserConfig
 from . import crud
 from . import database as db
 from . import storage as fs_storage
 from . import background_worker
+from .jobstore import JobStore
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding when installed
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -49,11 +71,208 @@ app = Flask(
     static_folder=str(_pkg_dir / "static"),
 )
 CORS(app)
+# create_app() may run more than once per process (main() then run_server())
+_artifact_routes_registered = False
+
+
+def _dumps(obj) -> str:
+    """Serialize to a JSON string, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+class _JSONProvider(DefaultJSONProvider):
+    """
+    jsonify without key sorting or ASCII escaping: both cost time on large
+    question payloads and clients don't depend on either. Encodes and
+    decodes with orjson when available.
+    """
+    sort_keys = False
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs.get("indent"):
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(
+            obj, default=kwargs.get("default", self.default),
+            option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+app.json = _JSONProvider(app)
+
+# ─── Job store ────────────────────────────────────────────────────────────────
+
+jobs = JobStore()
+
+# Every job is also mirrored to OUTPUT_DIR/jobs/<job_id>.json (its result
+# to <job_id>.result.json, a batch's job ids to <batch_id>.batch.json),
+# written atomically, so other worker processes and restarts can read it
+# without this process's memory. Finished jobs stay in memory for
+# JOB_RETENTION seconds (at most MAX_JOBS records).
+JOB_RETENTION = int(os.environ.get("PARSER_JOB_RETENTION", "86400"))
+MAX_JOBS = int(os.environ.get("PARSER_MAX_JOBS", "10000"))
+_PRUNE_INTERVAL = 60.0
+_last_prune = 0.0
+
+
+def _job_file(job_id: str, suffix: str = ".json") -> Optional[str]:
+    jobs_dir = os.path.join(app.config.get("OUTPUT_DIR", "output"), "jobs")
+    return safe_join(jobs_dir, f"{job_id}{suffix}")
+
+
+def _write_atomic(path: str, data: str):
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _save_job_record(job_id: str):
+    """Mirror a job's current state (minus the result body) to disk."""
+    job = jobs.get(job_id)
+    if job is None:
+        return
+    job.pop("result_json", None)
+    try:
+        _write_atomic(
+            _job_file(job_id), _dumps(job))
+    except OSError as e:
+        logger.warning(f"Failed to write job record {job_id}: {e}")
+
+
+def _save_job_result(job_id: str, result_json: str) -> bool:
+    """Write a finished job's result body to disk. False if that failed."""
+    try:
+        _write_atomic(_job_file(job_id, ".result.json"), result_json)
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to write job result {job_id}: {e}")
+        return False
+
+
+def _save_batch_record(batch_id: str, job_ids: list[str]):
+    """Mirror a batch's job ids to disk; pruning doesn't shrink this list."""
+    try:
+        _write_atomic(_job_file(batch_id, ".batch.json"), _dumps(job_ids))
+    except OSError as e:
+        logger.warning(f"Failed to write batch record {batch_id}: {e}")
+
+
+def _batch_job_ids(batch_id: str) -> list[str]:
+    """
+    Every job id in a batch: the disk record (in submission order) plus
+    any members still in memory, so jobs pruned from memory aren't lost.
+    """
+    ids = []
+    path = _job_file(batch_id, ".batch.json")
+    if path and os.path.isfile(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                ids = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read batch record {batch_id}: {e}")
+    ids.extend(job["id"] for job in jobs.batch(batch_id))
+    return list(dict.fromkeys(ids))
+
+
+def _load_job_record(job_id: str) -> Optional[dict]:
+    """Read a job record from disk, if there is one."""
+    path = _job_file(job_id)
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read job record {job_id}: {e}")
+        return None
 
-# ─── In-memory job store (use Redis/DB for production) ────────────────────────
 
-jobs: dict[str, dict] = {}
-jobs_lock = threading.Lock()
+def _prune_jobs(force: bool = False):
+    """
+    Drop old finished jobs from memory, at most once per _PRUNE_INTERVAL.
+    Their records stay readable from disk.
+    """
+    global _last_prune
+    now = time.monotonic()
+    if not force and now - _last_prune < _PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    jobs.prune(JOB_RETENTION, MAX_JOBS)
+
+
+def _forget_job(job_id: str) -> bool:
+    """Drop a job from memory and delete its files."""
+    removed = jobs.delete(job_id)
+    for suffix in (".json", ".result.json"):
+        path = _job_file(job_id, suffix)
+        if path and os.path.isfile(path):
+            os.remove(path)
+            removed = True
+    return removed
+
+
+# ─── Parse worker pool ────────────────────────────────────────────────────────
+# Async parse jobs queue here instead of each getting its own thread, so a
+# burst of requests waits its turn rather than parsing N PDFs at once. The
+# threads only drive jobs; the parsing itself runs in crud's process pool.
+
+PARSE_WORKERS = max(1, int(
+    os.environ.get("PARSER_WORKERS", str(os.cpu_count() or 1))))
+_parse_pool = ThreadPoolExecutor(
+    max_workers=PARSE_WORKERS, thread_name_prefix="parse-job")
+
+# Leading URL segments /questions/<path> tolerates in front of an image path
+_IMAGE_URL_PREFIXES = ("questions/", "storage/", "output/", "uploads/")
+
+# ─── Read cache ───────────────────────────────────────────────────────────────
+# Short-lived memo for the SQLite reads behind the dashboard's polling GETs
+# (/exams, /exam/<id>, /api/jobs). Every non-GET request and every finished
+# parse job clears it; background page progress shows up within the TTL.
+# Keys vary per exam, base URL and live job set, so the cache is an LRU of
+# at most READ_CACHE_MAX_ENTRIES, and expired entries are dropped when hit.
+
+READ_CACHE_TTL = float(os.environ.get("PARSER_READ_CACHE_TTL", "5"))
+READ_CACHE_MAX_ENTRIES = int(
+    os.environ.get("PARSER_READ_CACHE_MAX_ENTRIES", "256"))
+_read_cache: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+def _cached_read(key: tuple, loader, ttl: Optional[float] = None):
+    """Return loader() memoized under key for ttl (default READ_CACHE_TTL) seconds."""
+    ttl = READ_CACHE_TTL if ttl is None else ttl
+    if ttl <= 0:
+        return loader()
+    now = time.monotonic()
+    with _read_cache_lock:
+        hit = _read_cache.get(key)
+        if hit and hit[0] > now:
+            _read_cache.move_to_end(key)
+            return hit[1]
+        if hit:
+            del _read_cache[key]
+    value = loader()
+    with _read_cache_lock:
+        _read_cache[key] = (now + ttl, value)
+        _read_cache.move_to_end(key)
+        while len(_read_cache) > READ_CACHE_MAX_ENTRIES:
+            _read_cache.popitem(last=False)
+    return value
+
+
+def _invalidate_read_cache():
+    with _read_cache_lock:
+        _read_cache.clear()
 
 
 def create_app(config: dict = None) -> Flask:
@@ -71,6 +290,18 @@ def create_app(config: dict = None) -> Flask:
         project_root / "output" / "questions"))
     app.config.setdefault("MAX_CONTENT_LENGTH", 500 * 1024 * 1024)  # 500MB
     app.config.setdefault("ABSOLUTE_IMAGE_URLS", False)
+    # Behind nginx: hand file bodies to the proxy. The prefix must be an
+    # internal location aliased to the project root, e.g.
+    #   location /_protected/ { internal; alias /srv/pdf_parser_python/; }
+    app.config.setdefault(
+        "ACCEL_REDIRECT_PREFIX", os.getenv("PARSER_ACCEL_REDIRECT_PREFIX", ""))
+    # Behind Apache/lighttpd: let send_file emit X-Sendfile instead
+    app.config.setdefault("USE_X_SENDFILE", os.getenv(
+        "PARSER_USE_X_SENDFILE", "").strip().lower() in {"1", "true", "yes", "on"})
+    # Browser/CDN cache lifetime for artifacts (images, PDFs). Responses also
+    # carry an ETag, so 0 still lets clients revalidate with a cheap 304.
+    app.config.setdefault("ARTIFACT_MAX_AGE", int(
+        os.getenv("PARSER_ARTIFACT_MAX_AGE", "86400")))
 
     # Ensure directories exist
     Path(app.config["UPLOAD_DIR"]).mkdir(parents=True, exist_ok=True)
@@ -80,48 +311,93 @@ def create_app(config: dict = None) -> Flask:
     fs_storage.init_storage()
     db.init_db()
 
+    # Index existing question images once; parse jobs add their own later
+    for root in (
+        Path(app.config["IMAGE_BASE_DIR"]),
+        Path(app.config["OUTPUT_DIR"]) / "questions",
+        project_root / "storage" / "questions",
+        fs_storage.IMAGES_DIR,
+    ):
+        fs_storage.index_images(root)
+
+    global _artifact_routes_registered
+    if _artifact_routes_registered:
+        return app
+    _artifact_routes_registered = True
+
     # Static routes for binary artifacts
     @app.route("/output/<path:filename>")
     def serve_output(filename):
-        return send_from_directory(app.config["OUTPUT_DIR"], filename)
+        return _send_artifact(app.config["OUTPUT_DIR"], filename)
 
     @app.route("/storage/<path:filename>")
     def serve_storage(filename):
-        return send_from_directory(str(project_root / "storage"), filename)
+        return _send_artifact(str(project_root / "storage"), filename)
 
     @app.route("/uploads/<path:filename>")
     def serve_uploads(filename):
         """Serve files from uploads/ (images, pdfs)."""
-        return send_from_directory(str(project_root / "uploads"), filename)
+        return _send_artifact(str(project_root / "uploads"), filename)
 
     @app.route("/questions/<path:filename>")
     def serve_questions(filename):
         """
         Serve question images from various possible locations.
-        Uses fs_storage.resolve_image_path for robust lookup.
+        Uses the fs_storage image index, falling back to resolve_image_path.
         """
-        # Try resolving the path as is (might include redundant prefixes)
-        abs_path = fs_storage.resolve_image_path(filename)
-        
-        # If not found, try stripping common prefixes and resolving again
+        # Try the path as is (might include redundant prefixes)
+        abs_path = fs_storage.lookup_image(filename)
+
+        # If not found, strip the common prefixes and look up once more
         if not abs_path:
-            for prefix in ["questions/", "storage/", "output/", "uploads/", "uploads/images/"]:
-                if filename.startswith(prefix):
-                    stripped = filename[len(prefix):]
-                    abs_path = fs_storage.resolve_image_path(stripped)
-                    if abs_path:
-                        break
-        
+            stripped = filename
+            for prefix in _IMAGE_URL_PREFIXES:
+                stripped = stripped.removeprefix(prefix)
+            if stripped != filename:
+                abs_path = fs_storage.lookup_image(stripped)
+
+        if not abs_path:
+            abs_path = fs_storage.lookup_image_name(filename)
+
         if not abs_path:
             logger.warning(f"Image NOT FOUND: {filename}")
             return jsonify({"error": "Image not found", "path": filename}), 404
 
         target = Path(abs_path)
-        return send_from_directory(str(target.parent), target.name)
+        return _send_artifact(str(target.parent), target.name)
 
     return app
 
 
+def _send_artifact(directory: str, filename: str):
+    """
+    Serve a file from directory. With ACCEL_REDIRECT_PREFIX set, files under
+    the project root are handed to nginx via X-Accel-Redirect; everything
+    else goes through send_from_directory (which honours USE_X_SENDFILE and
+    answers conditional requests). Both are cacheable for ARTIFACT_MAX_AGE.
+    """
+    max_age = app.config.get("ARTIFACT_MAX_AGE", 0)
+    prefix = app.config.get("ACCEL_REDIRECT_PREFIX")
+    if prefix:
+        path = safe_join(directory, filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        try:
+            rel = Path(path).resolve().relative_to(_pkg_dir.parent.resolve())
+        except ValueError:
+            rel = None
+        if rel is not None:
+            mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            resp = Response(mimetype=mimetype)
+            resp.headers["X-Accel-Redirect"] = (
+                f"{prefix.rstrip('/')}/{rel.as_posix()}")
+            resp.cache_control.public = True
+            resp.cache_control.max_age = max_age
+            return resp
+    return send_from_directory(
+        directory, filename, conditional=True, etag=True, max_age=max_age)
+
+
 def _get_public_base_url() -> str:
     explicit = (
         app.config.get("PUBLIC_BASE_URL")
@@ -240,15 +516,17 @@ def dashboard():
 @app.route("/api/health", methods=["GET"])
 def health():
     """Health check endpoint."""
-    with jobs_lock:
-        active = sum(1 for j in jobs.values()
-                     if j["status"] in ("queued", "processing"))
-        total = len(jobs)
+    counts = jobs.status_counts()
+    queued = counts.get("queued", 0)
+    active = queued + counts.get("processing", 0)
+    total = sum(counts.values())
     return jsonify({
         "status": "healthy",
         "service": "pdf-parser",
         "version": "1.0.0",
         "active_jobs": active,
+        "queued_jobs": queued,
+        "workers": PARSE_WORKERS,
         "total_jobs": total,
     })
 
@@ -271,6 +549,170 @@ def info():
     })
 
 
+# ─── Upload helpers ──────────────────────────────────────────────────────────
+
+_UPLOAD_CHUNK = 1024 * 1024  # 1 MiB
+_PDF_SNIFF_BYTES = 1024       # %PDF- must appear within the first 1 KiB
+
+
+def _upload_too_large():
+    """413 response if the declared body size exceeds MAX_CONTENT_LENGTH."""
+    limit = app.config.get("MAX_CONTENT_LENGTH")
+    if limit and request.content_length and request.content_length > limit:
+        return jsonify({
+            "error": f"Upload exceeds the {limit // (1024 * 1024)}MB limit"
+        }), 413
+    return None
+
+
+def _upload_name(filename: str, default: str = "upload.pdf") -> str:
+    """
+    Filesystem-safe version of a client-supplied file name. secure_filename
+    drops non-ASCII characters, so a name that loses its stem or extension
+    that way ("考试.pdf" -> "pdf") falls back to default's stem with the
+    original extension.
+    """
+    name = secure_filename(filename or "")
+    stem, ext = os.path.splitext(name)
+    orig_ext = os.path.splitext(filename or "")[1]
+    if stem and ext == orig_ext:
+        return name
+    ext = secure_filename(orig_ext)
+    return f"{os.path.splitext(default)[0]}.{ext}" if ext else default
+
+
+class _HashingWriter:
+    """File wrapper that hashes and counts bytes as they are written."""
+
+    def __init__(self, f):
+        self._f = f
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+class _UploadRequest(Request):
+    """
+    Spool multipart file parts straight into UPLOAD_DIR so _save_upload can
+    rename them into place instead of copying them a second time. The
+    SHA-256 is taken while the part is written.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        upload_dir = current_app.config.get("UPLOAD_DIR")
+        if not upload_dir:
+            return super()._get_file_stream(
+                total_content_length, content_type, filename, content_length)
+        part = tempfile.NamedTemporaryFile(
+            "wb+", dir=upload_dir, prefix=".upload-", suffix=".part",
+            delete=False)
+        self.upload_parts.add(part.name)
+        return _HashingWriter(part)
+
+    @property
+    def upload_parts(self) -> set[str]:
+        """Spooled part files not yet moved into place."""
+        if "_upload_parts" not in self.__dict__:
+            self.__dict__["_upload_parts"] = set()
+        return self.__dict__["_upload_parts"]
+
+
+app.request_class = _UploadRequest
+
+
+@app.after_request
+def _expire_read_cache(response):
+    """Writes may touch any exam, so drop cached reads after each one."""
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        _invalidate_read_cache()
+    return response
+
+
+@app.teardown_request
+def _remove_upload_parts(exc=None):
+    """Delete spooled parts a handler didn't keep (rejected uploads etc.)."""
+    for path in getattr(request, "upload_parts", ()):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _read_head(stream) -> bytes:
+    head = b""
+    while len(head) < _PDF_SNIFF_BYTES:
+        chunk = stream.read(_PDF_SNIFF_BYTES - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _stream_to_disk(stream, dest: str, head: bytes = b"") -> tuple[str, int]:
+    """
+    Write head + the rest of stream to dest in fixed-size chunks, hashing
+    in the same pass. Returns (sha256 hex digest, size in bytes).
+    """
+    sha256 = hashlib.sha256(head)
+    size = len(head)
+    with open(dest, "wb") as f:
+        f.write(head)
+        while chunk := stream.read(_UPLOAD_CHUNK):
+            f.write(chunk)
+            sha256.update(chunk)
+            size += len(chunk)
+    return sha256.hexdigest(), size
+
+
+def _save_upload(
+    stream, dest: str, require_pdf: bool = False,
+) -> Optional[tuple[str, int]]:
+    """
+    Write an upload stream to dest and return its (sha256, size). Parts
+    already spooled to UPLOAD_DIR are renamed into place; anything else is
+    streamed to disk. With require_pdf, nothing is written (and None
+    returned) unless the stream starts like a PDF.
+    """
+    parts = getattr(request, "upload_parts", set())
+    spooled = getattr(stream, "name", None)
+    if isinstance(stream, _HashingWriter) and spooled in parts:
+        if require_pdf:
+            stream.seek(0)
+            if b"%PDF-" not in _read_head(stream):
+                return None
+        stream.close()
+        try:
+            os.replace(spooled, dest)
+        except OSError:
+            shutil.move(spooled, dest)  # dest on another filesystem
+        parts.discard(spooled)
+        return stream.sha256.hexdigest(), stream.size
+
+    head = b""
+    if require_pdf:
+        head = _read_head(stream)
+        if b"%PDF-" not in head:
+            return None
+    return _stream_to_disk(stream, dest, head)
+
+
+def _not_a_pdf():
+    return jsonify({"error": "Uploaded file is not a PDF"}), 415
+
+
+def _is_raw_pdf_upload() -> bool:
+    """Body is the PDF itself (Content-Type: application/pdf)."""
+    return request.mimetype == "application/pdf"
+
+
 # ─── Parse Endpoint ──────────────────────────────────────────────────────────
 
 
@@ -281,29 +723,48 @@ def parse_pdf():
 
     Accepts either:
         - A file upload (multipart/form-data)
+        - A raw PDF body (application/pdf, optional X-Filename header;
+          options go in the query string)
         - A JSON body with file_path pointing to an existing file
 
     Returns a job ID for status polling.
     """
+    too_large = _upload_too_large()
+    if too_large:
+        return too_large
+
     job_id = str(uuid.uuid4())
 
     # Determine input source
     pdf_path = None
+    raw_pdf = _is_raw_pdf_upload()
+    is_multipart = request.mimetype == "multipart/form-data"
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        body = {}
+
+    if raw_pdf:
+        # Raw body (also covers Transfer-Encoding: chunked)
+        filename = _upload_name(request.headers.get("X-Filename", ""))
+        upload_dir = Path(app.config["UPLOAD_DIR"])
+        pdf_path = str(upload_dir / f"{job_id}_{filename}")
+        if not _save_upload(request.stream, pdf_path, require_pdf=True):
+            return _not_a_pdf()
 
-    if "file" in request.files:
+    elif is_multipart and "file" in request.files:
         # File upload
         file = request.files["file"]
         if not file.filename:
             return jsonify({"error": "No file selected"}), 400
 
         upload_dir = Path(app.config["UPLOAD_DIR"])
-        pdf_path = str(upload_dir / f"{job_id}_{file.filename}")
-        file.save(pdf_path)
+        pdf_path = str(upload_dir / f"{job_id}_{_upload_name(file.filename)}")
+        if not _save_upload(file.stream, pdf_path, require_pdf=True):
+            return _not_a_pdf()
 
     elif request.is_json:
         # JSON body with file path
-        data = request.get_json()
-        pdf_path = data.get("file_path")
+        pdf_path = body.get("file_path")
         if not pdf_path or not os.path.exists(pdf_path):
             return jsonify({
                 "error": f"File not found: {pdf_path}"
@@ -314,9 +775,8 @@ def parse_pdf():
         }), 400
 
     # Parse config from request
-    params = request.form if request.content_type and "multipart" in request.content_type else (
-        request.get_json() or {}
-    )
+    params = request.args if raw_pdf else (
+        request.form if is_multipart else body)
 
     config = ParserConfig(
         output_dir=app.config.get("OUTPUT_DIR", "output"),
@@ -332,27 +792,24 @@ def parse_pdf():
     filename = os.path.basename(pdf_path) if pdf_path else "unknown.pdf"
 
     # Create job entry
-    with jobs_lock:
-        jobs[job_id] = {
-            "id": job_id,
-            "status": "queued",
-            "pdf_path": pdf_path,
-            "filename": filename,
-            "created_at": time.time(),
-            "started_at": None,
-            "completed_at": None,
-            "result": None,
-            "error": None,
-            "progress": 0,
-        }
+    jobs.create({
+        "id": job_id,
+        "status": "queued",
+        "pdf_path": pdf_path,
+        "filename": filename,
+        "created_at": time.time(),
+        "started_at": None,
+        "completed_at": None,
+        "result_json": None,
+        "questions_count": None,
+        "error": None,
+        "progress": 0,
+    })
+    _save_job_record(job_id)
 
-    # Start parsing in background thread
-    thread = threading.Thread(
-        target=_run_parse_job,
-        args=(job_id, pdf_path, config),
-        daemon=True,
-    )
-    thread.start()
+    # Queue parsing on the worker pool
+    _parse_pool.submit(_run_parse_job, job_id, pdf_path, config)
+    _prune_jobs()
 
     return jsonify({
         "job_id": job_id,
@@ -368,20 +825,36 @@ def parse_pdf_sync():
 
     For small PDFs or when the caller wants to wait.
     """
-    pdf_path = None
+    too_large = _upload_too_large()
+    if too_large:
+        return too_large
 
-    if "file" in request.files:
+    pdf_path = None
+    raw_pdf = _is_raw_pdf_upload()
+    is_multipart = request.mimetype == "multipart/form-data"
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        body = {}
+
+    if raw_pdf:
+        filename = _upload_name(request.headers.get("X-Filename", ""))
+        upload_dir = Path(app.config["UPLOAD_DIR"])
+        job_id = str(uuid.uuid4())
+        pdf_path = str(upload_dir / f"{job_id}_{filename}")
+        if not _save_upload(request.stream, pdf_path, require_pdf=True):
+            return _not_a_pdf()
+    elif is_multipart and "file" in request.files:
         file = request.files["file"]
         if not file.filename:
             return jsonify({"error": "No file selected"}), 400
 
         upload_dir = Path(app.config["UPLOAD_DIR"])
         job_id = str(uuid.uuid4())
-        pdf_path = str(upload_dir / f"{job_id}_{file.filename}")
-        file.save(pdf_path)
+        pdf_path = str(upload_dir / f"{job_id}_{_upload_name(file.filename)}")
+        if not _save_upload(file.stream, pdf_path, require_pdf=True):
+            return _not_a_pdf()
     elif request.is_json:
-        data = request.get_json()
-        pdf_path = data.get("file_path")
+        pdf_path = body.get("file_path")
         if not pdf_path or not os.path.exists(pdf_path):
             return jsonify({"error": f"File not found: {pdf_path}"}), 404
     else:
@@ -389,9 +862,8 @@ def parse_pdf_sync():
             "error": "Provide a file upload or JSON with file_path"
         }), 400
 
-    params = request.form if request.content_type and "multipart" in request.content_type else (
-        request.get_json() or {}
-    )
+    params = request.args if raw_pdf else (
+        request.form if is_multipart else body)
 
     config = ParserConfig(
         output_dir=app.config.get("OUTPUT_DIR", "output"),
@@ -404,8 +876,7 @@ def parse_pdf_sync():
     )
 
     try:
-        engine = ParserEngine(config)
-        result = engine.parse(pdf_path)
+        result = crud.parse_in_pool(pdf_path, config)
         payload = result.model_dump()
         _rewrite_payload_images(payload)
         return jsonify(payload), 200
@@ -419,32 +890,10 @@ def parse_pdf_sync():
 @app.route("/api/status/<job_id>", methods=["GET"])
 def get_status(job_id: str):
     """Get the status of a parse job."""
-    with jobs_lock:
-        job = jobs.get(job_id)
+    job = jobs.get(job_id) or _load_job_record(job_id)
 
     if job:
-        # Compute duration
-        duration = None
-        if job["started_at"] and job["completed_at"]:
-            duration = round(job["completed_at"] - job["started_at"], 2)
-
-        # Get question count from result
-        questions_count = None
-        if job["result"]:
-            questions_count = len(job["result"].get("questions", []))
-
-        return jsonify({
-            "id": job["id"],
-            "status": job["status"],
-            "progress": job["progress"],
-            "filename": job.get("filename", ""),
-            "created_at": job["created_at"],
-            "started_at": job["started_at"],
-            "completed_at": job["completed_at"],
-            "error": job["error"],
-            "duration": duration,
-            "questions_count": questions_count,
-        })
+        return jsonify(_job_status_payload(job))
 
     # ── Fallback: check SQLite for completed exams ───────────────
     exam = db.get_exam_by_job_id(job_id)
@@ -465,11 +914,119 @@ def get_status(job_id: str):
     return jsonify({"error": "Job not found"}), 404
 
 
+def _job_status_payload(job: dict) -> dict:
+    """Status document for a job record (shared by polling and SSE)."""
+    # Compute duration
+    duration = None
+    if job["started_at"] and job["completed_at"]:
+        duration = round(job["completed_at"] - job["started_at"], 2)
+
+    return {
+        "id": job["id"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "filename": job.get("filename", ""),
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "completed_at": job["completed_at"],
+        "error": job["error"],
+        "duration": duration,
+        "questions_count": job.get("questions_count"),
+    }
+
+
+_STREAM_KEEPALIVE = 15.0
+_STREAM_POLL = 0.5
+_STREAM_MAX_JOBS = 200
+# Each open stream holds a server thread for as long as it runs, so only a
+# few may be open at once; clients beyond that get a 503 and poll instead.
+MAX_STREAMS = max(1, int(os.environ.get("PARSER_MAX_STREAMS", "4")))
+_stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+
+
+@app.route("/api/stream", methods=["GET"])
+@app.route("/api/stream/<job_id>", methods=["GET"])
+def stream_status(job_id: Optional[str] = None):
+    """
+    Server-Sent Events feed of job status. One stream carries every job
+    a client follows: /api/stream/<job_id>, /api/stream?jobs=<id>,<id>
+    and/or ?batch=<batch_id>. Sends a job's status document whenever its
+    status/progress changes (an "event: gone" frame if it disappears), a
+    comment line as keep-alive, and closes once every job is finished.
+    Returns 503 when MAX_STREAMS streams are already open.
+    """
+    ids = [job_id] if job_id else [
+        jid for jid in request.args.get("jobs", "").split(",") if jid]
+    batch_id = request.args.get("batch")
+    if batch_id:
+        ids.extend(_batch_job_ids(batch_id))
+    ids = list(dict.fromkeys(ids))[:_STREAM_MAX_JOBS]
+
+    current = {}
+    for jid in ids:
+        job = jobs.get(jid) or _load_job_record(jid)
+        if job is not None:
+            current[jid] = job
+    if not current:
+        return jsonify({"error": "Job not found"}), 404
+
+    if not _stream_slots.acquire(blocking=False):
+        resp = jsonify({"error": "Too many open streams, poll /api/status"})
+        resp.status_code = 503
+        resp.headers["Retry-After"] = "5"
+        return resp
+
+    def events(current):
+        last: dict[str, tuple] = {}
+        live = list(current)
+        last_write = 0.0
+        while True:
+            for jid, job in current.items():
+                if job is None:
+                    live.remove(jid)
+                    yield ("event: gone\ndata: "
+                           f"{_dumps({'id': jid, 'error': 'Job not found'})}\n\n")
+                    last_write = time.monotonic()
+                    continue
+                state = (job["status"], job["progress"])
+                if state != last.get(jid):
+                    last[jid] = state
+                    yield f"data: {_dumps(_job_status_payload(job))}\n\n"
+                    last_write = time.monotonic()
+                if job["status"] in ("completed", "failed") and jid in live:
+                    live.remove(jid)
+            if not live:
+                return
+            if time.monotonic() - last_write >= _STREAM_KEEPALIVE:
+                yield ": keep-alive\n\n"
+                last_write = time.monotonic()
+
+            # Jobs in this process wake us on change; jobs only on disk
+            # (another worker process) are re-read every _STREAM_POLL
+            on_disk = [jid for jid in live if jobs.get(jid) is None]
+            in_memory = [jid for jid in live if jid not in on_disk]
+            timeout = _STREAM_POLL if on_disk else _STREAM_KEEPALIVE
+            if in_memory:
+                current = jobs.watch_many(in_memory, last, timeout)
+            else:
+                time.sleep(timeout)
+                current = {}
+            for jid in on_disk + [j for j, v in current.items() if v is None]:
+                current[jid] = _load_job_record(jid)
+
+    resp = Response(
+        events(current),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    resp.call_on_close(_stream_slots.release)
+    return resp
+
+
 @app.route("/api/result/<job_id>", methods=["GET"])
 def get_result(job_id: str):
     """Get the full result of a completed parse job."""
-    with jobs_lock:
-        job = jobs.get(job_id)
+    job = jobs.get(job_id) or _load_job_record(job_id)
 
     if job:
         if job["status"] != "completed":
@@ -477,14 +1034,24 @@ def get_result(job_id: str):
                 "error": f"Job not complete, status: {job['status']}",
                 "status": job["status"],
             }), 400
-        # Ensure blocks are present (handles jobs stored before enrichment)
-        result_data = job["result"]
-        crud.enrich_result_with_blocks(result_data)
-        _rewrite_payload_images(result_data)
-        return jsonify(result_data)
+        # Serialized once at completion; only absolute image URLs need
+        # per-request rewriting
+        result_json = job.get("result_json")
+        result_path = _job_file(job_id, ".result.json")
+        if result_json is None and result_path and os.path.isfile(result_path):
+            if not _should_rewrite_images():
+                return send_file(
+                    os.path.abspath(result_path), mimetype="application/json")
+            with open(result_path, encoding="utf-8") as f:
+                result_json = f.read()
+        if result_json is not None:
+            if _should_rewrite_images():
+                return jsonify(
+                    _rewrite_payload_images(json.loads(result_json)))
+            return Response(result_json, mimetype="application/json")
 
     # ── Fallback: load from SQLite ────────────────────────────────
-    exam = db.get_exam_by_job_id(job_id)
+    exam = db.get_exam_by_job_id(job_id, kinds=("result_json",))
     if not exam:
         return jsonify({"error": "Job not found"}), 404
 
@@ -499,7 +1066,21 @@ def get_result(job_id: str):
             logger.warning(
                 f"Failed to serve stored result_json for job {job_id}")
 
-    # Reconstruct from relational data as last resort
+    # Reconstruct from relational data as last resort. A finished exam only
+    # changes through the edit endpoints, which clear the read cache, so the
+    # serialized body can be kept much longer than the dashboard reads.
+    base = _get_public_base_url() if _should_rewrite_images() else ""
+    ttl = None if exam.get("status") in ("pending", "processing") else 300.0
+    body = _cached_read(
+        ("result", exam["id"], base),
+        lambda: _dumps(_reconstruct_result(exam)),
+        ttl=ttl,
+    )
+    return Response(body, mimetype="application/json")
+
+
+def _reconstruct_result(exam: dict) -> dict:
+    """Rebuild a parse result payload from an exam's relational rows."""
     exam_questions = db.get_exam_questions(exam["id"])
     # Convert each hydrated question to blocks format
     for q in exam_questions:
@@ -589,8 +1170,7 @@ def get_result(job_id: str):
         "validation": validation_obj,
         "exam_db_id": exam.get("id"),
     }
-    _rewrite_payload_images(reconstructed)
-    return jsonify(reconstructed)
+    return _rewrite_payload_images(reconstructed)
 
 
 @app.route("/api/jobs", methods=["GET"])
@@ -600,38 +1180,38 @@ def list_jobs():
     seen_job_ids: set[str] = set()
 
     # 1. In-memory jobs (active / recently completed)
-    with jobs_lock:
-        for job_id, job in jobs.items():
-            seen_job_ids.add(job_id)
-            duration = None
-            if job["started_at"] and job["completed_at"]:
-                duration = round(job["completed_at"] - job["started_at"], 2)
-            elif job["started_at"]:
-                duration = round(time.time() - job["started_at"], 2)
-
-            questions_count = None
-            if job["result"]:
-                questions_count = len(job["result"].get("questions", []))
+    for job in jobs.all():
+        seen_job_ids.add(job["id"])
+        duration = None
+        if job["started_at"] and job["completed_at"]:
+            duration = round(job["completed_at"] - job["started_at"], 2)
+        elif job["started_at"]:
+            duration = round(time.time() - job["started_at"], 2)
 
-            result.append({
-                "id": job["id"],
-                "status": job["status"],
-                "progress": job["progress"],
-                "filename": job.get("filename", ""),
-                "pdf_path": job.get("pdf_path", ""),
-                "created_at": job["created_at"],
-                "error": job["error"],
-                "duration": duration,
-                "questions_count": questions_count,
-            })
+        questions_count = job.get("questions_count")
+
+        result.append({
+            "id": job["id"],
+            "status": job["status"],
+            "progress": job["progress"],
+            "filename": job.get("filename", ""),
+            "pdf_path": job.get("pdf_path", ""),
+            "created_at": job["created_at"],
+            "error": job["error"],
+            "duration": duration,
+            "questions_count": questions_count,
+        })
 
     # 2. SQLite exams not already in memory
+    limit = request.args.get("limit", type=int)
+    exclude = frozenset(seen_job_ids)
     try:
-        exams = db.list_exams()
+        exams = _cached_read(
+            ("db.list_exams_summary", exclude, limit),
+            lambda: db.list_exams_summary(exclude, limit=limit),
+        )
         for exam in exams:
-            jid = exam.get("job_id", "")
-            if not jid or jid in seen_job_ids:
-                continue
+            jid = exam["job_id"]
             result.append({
                 "id": jid,
                 "exam_db_id": exam.get("id"),
@@ -665,76 +1245,85 @@ def batch_parse():
         ...
     }
     """
-    data = request.get_json()
-    if not data or "files" not in data:
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or "files" not in data:
         return jsonify({
             "error": "Provide a JSON body with 'files' array"
         }), 400
 
-    files = data["files"]
+    files = _existing_paths(data["files"])
     batch_id = str(uuid.uuid4())
-    job_ids = []
+    new_jobs = []
+    tasks = []
 
-    for file_path in files:
-        if not os.path.exists(file_path):
-            continue
+    # Shared by every file; only the name and id vary per job
+    base_config = ParserConfig(
+        output_dir=app.config.get("OUTPUT_DIR", "output"),
+        image_base_dir=app.config.get("IMAGE_BASE_DIR", "storage/questions"),
+        exam_provider=data.get("exam_provider", ""),
+        log_level=data.get("log_level", "INFO"),
+    )
+    base_job = {
+        "batch_id": batch_id,
+        "status": "queued",
+        "created_at": time.time(),
+        "started_at": None,
+        "completed_at": None,
+        "result_json": None,
+        "questions_count": None,
+        "error": None,
+        "progress": 0,
+    }
 
+    for file_path in files:
         job_id = str(uuid.uuid4())
-
-        config = ParserConfig(
-            output_dir=app.config.get("OUTPUT_DIR", "output"),
-            image_base_dir=app.config.get(
-                "IMAGE_BASE_DIR", "storage/questions"
-            ),
-            exam_name=Path(file_path).stem,
-            exam_provider=data.get("exam_provider", ""),
-            exam_id=job_id,
-            log_level=data.get("log_level", "INFO"),
-        )
-
-        with jobs_lock:
-            jobs[job_id] = {
-                "id": job_id,
-                "batch_id": batch_id,
-                "status": "queued",
-                "pdf_path": file_path,
-                "created_at": time.time(),
-                "started_at": None,
-                "completed_at": None,
-                "result": None,
-                "error": None,
-                "progress": 0,
-            }
-
-        thread = threading.Thread(
-            target=_run_parse_job,
-            args=(job_id, file_path, config),
-            daemon=True,
-        )
-        thread.start()
-        job_ids.append(job_id)
+        config = dataclasses.replace(
+            base_config, exam_name=Path(file_path).stem, exam_id=job_id)
+        new_jobs.append({**base_job, "id": job_id, "pdf_path": file_path})
+        tasks.append((job_id, file_path, config))
+
+    # Register the whole batch at once, then queue it
+    jobs.create_many(new_jobs)
+    for job in new_jobs:
+        _save_job_record(job["id"])
+    _save_batch_record(batch_id, [job["id"] for job in new_jobs])
+    for task in tasks:
+        _parse_pool.submit(_run_parse_job, *task)
+    _prune_jobs()
 
     return jsonify({
         "batch_id": batch_id,
-        "job_ids": job_ids,
-        "total_files": len(job_ids),
+        "job_ids": [job["id"] for job in new_jobs],
+        "total_files": len(new_jobs),
     }), 202
 
 
+def _existing_paths(paths: list[str]) -> list[str]:
+    """
+    Keep the paths that exist, in order. Large batches are checked in
+    parallel since each stat can be a round trip on network storage.
+    """
+    if len(paths) <= 8:
+        return [p for p in paths if os.path.exists(p)]
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        exists = list(pool.map(os.path.exists, paths))
+    return [p for p, ok in zip(paths, exists) if ok]
+
+
 @app.route("/api/batch/<batch_id>", methods=["GET"])
 def batch_status(batch_id: str):
     """Get status of all jobs in a batch."""
-    with jobs_lock:
-        batch_jobs = [
-            {
-                "id": j["id"],
-                "status": j["status"],
-                "progress": j["progress"],
-                "pdf_path": j.get("pdf_path", ""),
-            }
-            for j in jobs.values()
-            if j.get("batch_id") == batch_id
-        ]
+    batch_jobs = []
+    for jid in _batch_job_ids(batch_id):
+        j = jobs.get(jid) or _load_job_record(jid)
+        if j is None:
+            continue
+        batch_jobs.append({
+            "id": j["id"],
+            "status": j["status"],
+            "progress": j["progress"],
+            "pdf_path": j.get("pdf_path", ""),
+        })
 
     if not batch_jobs:
         return jsonify({"error": "Batch not found"}), 404
@@ -758,85 +1347,72 @@ def _run_parse_job(job_id: str, pdf_path: str, config: ParserConfig):
     """Run a parse job in background thread. Persists results to SQLite."""
     import traceback
 
-    with jobs_lock:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["started_at"] = time.time()
-        jobs[job_id]["progress"] = 10
+    jobs.update(
+        job_id, status="processing", started_at=time.time(), progress=30)
+    _save_job_record(job_id)
 
     try:
-        logger.info(f"Job {job_id}: creating engine...")
-        engine = ParserEngine(config)
-
-        with jobs_lock:
-            jobs[job_id]["progress"] = 30
 
         logger.info(f"Job {job_id}: starting parse of {pdf_path}")
 
-        def progress_cb(current, total):
-            # Scale 0-100% of extraction to 30-90% of total job progress
-            pct = 30 + (current / total) * 60
-            with jobs_lock:
-                jobs[job_id]["progress"] = round(pct, 1)
+        last = {"pct": 30, "saved_at": 0.0}
 
-        result = engine.parse(pdf_path, progress_callback=progress_cb)
+        def progress_cb(current, total):
+            # Scale 0-100% of extraction to 30-90% of total job progress,
+            # in whole percent so a long PDF reports at most ~60 changes
+            pct = 30 + current * 60 // total
+            if pct == last["pct"]:
+                return
+            last["pct"] = pct
+            jobs.set_progress(job_id, pct)
+            # The on-disk mirror only needs to be roughly current
+            now = time.monotonic()
+            if now - last["saved_at"] >= 1.0 or current == total:
+                last["saved_at"] = now
+                _save_job_record(job_id)
+
+        # Parse in a worker process so concurrent jobs don't share a GIL
+        result = crud.parse_in_pool(pdf_path, config, progress_cb)
+
+        # Images are written to <image_base_dir>/<exam_id>/ and reported as
+        # "questions/<exam_id>/<file>"; index them as "<exam_id>/<file>"
+        image_base = Path(config.image_base_dir)
+        exam_dirs = {
+            Path(path).parent.name
+            for q in result.questions
+            for path in (
+                q.question_images + q.answer_images + q.explanation_images)
+        }
+        for exam_dir in exam_dirs:
+            fs_storage.index_images(image_base / exam_dir, base=image_base)
 
         # ── Build UI-compatible result dict ───────────────────────────
         result_dict = result.model_dump()
         crud.enrich_result_with_blocks(result_dict)
-
-        # ── Persist to SQLite ─────────────────────────────────────────
-        persist_exam_id = None
-        try:
-            exam_name = config.exam_name or Path(pdf_path).stem
-            stored_pdf = fs_storage.save_pdf(
-                pdf_path, os.path.basename(pdf_path))
-
-            # Serialize result for persistent storage
-            result_json_str = json.dumps(
-                result_dict, ensure_ascii=False, default=str)
-
-            persist_exam_id = db.insert_exam(
-                name=exam_name,
-                file_path=stored_pdf,
-                source_pdf=result.exam.source_pdf,
-                file_hash=result.exam.file_hash,
-                file_size_bytes=result.exam.file_size_bytes,
-                total_pages=result.exam.total_pages,
-                total_questions=len(result.questions),
-                provider=config.exam_provider,
-                version=config.exam_version,
-                parser_version=result.parse_version.parser_version,
-                job_id=job_id,
-                result_json=result_json_str,
-                original_filename=jobs.get(job_id, {}).get("filename", ""),
-            )
-
-            questions_data = [q.model_dump() for q in result.questions]
-            db.bulk_insert_questions(persist_exam_id, questions_data)
-
-            stored_count = db.count_exam_questions(persist_exam_id)
-            logger.info(
-                f"Job {job_id}: persisted to SQLite — exam_id={persist_exam_id}, "
-                f"parsed={len(result.questions)}, stored={stored_count}, "
-                f"db_path={db.get_db_path()}"
-            )
-        except Exception as persist_err:
-            logger.error(
-                f"Job {job_id}: SQLite persistence FAILED: {persist_err}",
-                exc_info=True,
-            )
-            # Rollback partial DB data
-            if persist_exam_id is not None:
-                try:
-                    db.delete_exam(persist_exam_id)
-                except Exception:
-                    pass
-
-        with jobs_lock:
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["completed_at"] = time.time()
-            jobs[job_id]["progress"] = 100
-            jobs[job_id]["result"] = result_dict
+        for q in result_dict.get("questions", []):
+            _normalize_question_images(q)
+
+        # Serialized once: stored in SQLite and served by /api/result as-is
+        result_json_str = _dumps(result_dict)
+
+        # SQLite is written by the persistence thread; the job reads as
+        # completed now and its result is served from the job files
+        _persist_queue.put((
+            job_id, pdf_path, config, result, result_json_str,
+            (jobs.get(job_id) or {}).get("filename", ""),
+        ))
+
+        # The result body lives on disk; keep it in memory only if that failed
+        stored = _save_job_result(job_id, result_json_str)
+        jobs.update(
+            job_id,
+            status="completed",
+            completed_at=time.time(),
+            progress=100,
+            result_json=None if stored else result_json_str,
+            questions_count=len(result.questions),
+        )
+        _save_job_record(job_id)
 
         logger.info(
             f"Job {job_id} completed: "
@@ -847,10 +1423,90 @@ def _run_parse_job(job_id: str, pdf_path: str, config: ParserConfig):
         tb = traceback.format_exc()
         logger.error(f"Job {job_id} failed: {e}\n{tb}")
 
-        with jobs_lock:
-            jobs[job_id]["status"] = "failed"
-            jobs[job_id]["completed_at"] = time.time()
-            jobs[job_id]["error"] = f"{e}\n{tb}"
+        jobs.update(
+            job_id,
+            status="failed",
+            completed_at=time.time(),
+            error=f"{e}\n{tb}",
+        )
+        _save_job_record(job_id)
+
+
+# ─── Result persistence ───────────────────────────────────────────────────────
+# Finished parse jobs are written to SQLite by a single writer thread, so a
+# job reports completed as soon as parsing ends and parallel jobs don't
+# contend for SQLite's write lock. Queued writes are drained at exit.
+
+_persist_queue: "queue.Queue[tuple]" = queue.Queue()
+
+
+def _persist_result(
+    job_id: str,
+    pdf_path: str,
+    config: ParserConfig,
+    result,
+    result_json_str: str,
+    filename: str,
+):
+    """Store a finished job's PDF, exam row and questions."""
+    persist_exam_id = None
+    try:
+        exam_name = config.exam_name or Path(pdf_path).stem
+        stored_pdf = fs_storage.save_pdf(
+            pdf_path, os.path.basename(pdf_path))
+
+        persist_exam_id = db.insert_exam(
+            name=exam_name,
+            file_path=stored_pdf,
+            source_pdf=result.exam.source_pdf,
+            file_hash=result.exam.file_hash,
+            file_size_bytes=result.exam.file_size_bytes,
+            total_pages=result.exam.total_pages,
+            total_questions=len(result.questions),
+            provider=config.exam_provider,
+            version=config.exam_version,
+            parser_version=result.parse_version.parser_version,
+            job_id=job_id,
+            result_json=result_json_str,
+            original_filename=filename,
+        )
+
+        questions_data = [q.model_dump() for q in result.questions]
+        db.bulk_insert_questions(persist_exam_id, questions_data)
+
+        stored_count = db.count_exam_questions(persist_exam_id)
+        logger.info(
+            f"Job {job_id}: persisted to SQLite — exam_id={persist_exam_id}, "
+            f"parsed={len(result.questions)}, stored={stored_count}, "
+            f"db_path={db.get_db_path()}"
+        )
+    except Exception as persist_err:
+        logger.error(
+            f"Job {job_id}: SQLite persistence FAILED: {persist_err}",
+            exc_info=True,
+        )
+        # Rollback partial DB data
+        if persist_exam_id is not None:
+            try:
+                db.delete_exam(persist_exam_id)
+            except Exception:
+                pass
+
+    _invalidate_read_cache()
+
+
+def _persist_worker():
+    while True:
+        item = _persist_queue.get()
+        try:
+            _persist_result(*item)
+        finally:
+            _persist_queue.task_done()
+
+
+threading.Thread(
+    target=_persist_worker, name="persist-results", daemon=True).start()
+atexit.register(_persist_queue.join)
 
 
 # ─── Persistent API Endpoints (SQLite-backed) ────────────────────────────────
@@ -869,6 +1525,10 @@ def upload_pdf():
     Returns:
         {"exam_id": int, "status": "pending", "total_pages": int}
     """
+    too_large = _upload_too_large()
+    if too_large:
+        return too_large
+
     if "file" not in request.files:
         return jsonify({"error": "No file provided"}), 400
 
@@ -879,11 +1539,16 @@ def upload_pdf():
     if not file.filename.lower().endswith(".pdf"):
         return jsonify({"error": "Only PDF files are accepted"}), 400
 
-    # Save uploaded file temporarily
-    upload_dir = Path(app.config["UPLOAD_DIR"])
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    temp_path = str(upload_dir / file.filename)
-    file.save(temp_path)
+    # Write the upload straight to its permanent place, hashing it on the
+    # way; the page count comes from the trailer, so that's the only pass.
+    # Prefixed so a re-upload can't overwrite an exam's PDF mid-parse.
+    safe_name = f"{uuid.uuid4()}_{_upload_name(file.filename)}"
+    fs_storage.RAW_PDFS_DIR.mkdir(parents=True, exist_ok=True)
+    pdf_path = str(fs_storage.RAW_PDFS_DIR / safe_name)
+    saved = _save_upload(file.stream, pdf_path, require_pdf=True)
+    if not saved:
+        return _not_a_pdf()
+    file_hash, file_size = saved
 
     # Extract optional metadata from form
     exam_name = request.form.get("exam_name", "") or Path(file.filename).stem
@@ -891,23 +1556,15 @@ def upload_pdf():
     exam_version = request.form.get("exam_version", "")
 
     try:
-        import hashlib as _hashlib
+        # Already in raw_pdfs/, so this only resolves the relative path
+        stored_pdf_path = fs_storage.save_pdf(pdf_path, safe_name)
 
-        # Store PDF persistently
-        stored_pdf_path = fs_storage.save_pdf(temp_path, file.filename)
-
-        # Quick metadata computation
-        file_size = os.path.getsize(temp_path)
-        sha256 = _hashlib.sha256()
-        with open(temp_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        file_hash = sha256.hexdigest()
-
-        # Get page count (fast — just opens PDF header)
-        import fitz as _fitz
-        with _fitz.open(temp_path) as _doc:
-            total_pages = _doc.page_count
+        # Get page count from the trailer; full open only if that fails
+        total_pages = fs_storage.fast_page_count(pdf_path)
+        if total_pages is None:
+            import fitz as _fitz
+            with _fitz.open(pdf_path) as _doc:
+                total_pages = _doc.page_count
 
         # Create exam row (status = 'pending')
         exam_id = db.insert_exam(
@@ -943,7 +1600,7 @@ def upload_pdf():
         # Spawn background worker
         background_worker.spawn_worker(
             exam_id=exam_id,
-            pdf_path=temp_path,
+            pdf_path=pdf_path,
             config=config,
             start_from_page=0,
         )
@@ -966,10 +1623,17 @@ def get_exam(exam_id: int):
     Get full exam data from SQLite.
     Never re-parses the PDF.
     """
-    exam = crud.get_exam(exam_id)
+    base = _get_public_base_url() if _should_rewrite_images() else ""
+
+    def load():
+        exam = crud.get_exam(exam_id)
+        if exam:
+            _rewrite_payload_images(exam)
+        return exam
+
+    exam = _cached_read(("exam", exam_id, base), load)
     if not exam:
         return jsonify({"error": "Exam not found"}), 404
-    _rewrite_payload_images(exam)
     return jsonify(exam)
 
 
@@ -991,7 +1655,7 @@ def get_exam_question(exam_id: int, number: int):
 @app.route("/exams", methods=["GET"])
 def list_exams():
     """List all exams (summary)."""
-    exams = crud.list_exams()
+    exams = _cached_read(("crud.list_exams",), crud.list_exams)
     return jsonify(exams)
 
 
@@ -1019,7 +1683,7 @@ def pause_exam(exam_id: int):
         }), 409
 
     # Set status to paused (worker will see this on next page check)
-    db.update_exam(exam_id, status="paused")
+    db.update_exam_status(exam_id, "paused")
 
     # Also signal the in-memory worker for faster response
     worker = background_worker.get_worker(exam_id)
@@ -1207,7 +1871,8 @@ def exam_validation(exam_id: int):
     If parsing is still in progress, returns a partial summary from
     what's been committed so far.
     """
-    exam = db.get_exam(exam_id)
+    exam = db.get_exam(
+        exam_id, include_blobs=True, kinds=("validation_json",))
     if not exam:
         return jsonify({"error": "Exam not found"}), 404
 
@@ -1349,8 +2014,9 @@ def update_image(image_id: int):
         if not exam_name:
             return jsonify({"error": "exam_name is required"}), 400
 
-        temp_path = str(Path(app.config["UPLOAD_DIR"]) / file.filename)
-        file.save(temp_path)
+        temp_path = str(Path(app.config["UPLOAD_DIR"]) /
+                        f"{uuid.uuid4()}_{_upload_name(file.filename, 'image.png')}")
+        _save_upload(file.stream, temp_path)
 
         try:
             crud.replace_image(image_id, temp_path, exam_name)
@@ -1384,7 +2050,7 @@ def delete_exam(exam_id: int):
     # Stop any background parsing worker first
     worker = background_worker.get_worker(exam_id)
     if worker:
-        db.update_exam(exam_id, status="paused")
+        db.update_exam_status(exam_id, "paused")
         worker.request_stop()
 
     # Find associated in-memory job if any
@@ -1397,9 +2063,7 @@ def delete_exam(exam_id: int):
     
     # Purge from memory
     if job_id_to_purge:
-        with jobs_lock:
-            if job_id_to_purge in jobs:
-                del jobs[job_id_to_purge]
+        _forget_job(job_id_to_purge)
     
     return jsonify({"success": True, "message": f"Exam {exam_id} deleted"})
 
@@ -1407,10 +2071,8 @@ def delete_exam(exam_id: int):
 @app.route("/api/jobs/<job_id>", methods=["DELETE"])
 def delete_job_api(job_id: str):
     """Delete a job from in-memory store."""
-    with jobs_lock:
-        if job_id in jobs:
-            del jobs[job_id]
-            return jsonify({"success": True, "message": f"Job {job_id} removed from memory"})
+    if _forget_job(job_id):
+        return jsonify({"success": True, "message": f"Job {job_id} removed from memory"})
     return jsonify({"error": "Job not found in memory"}), 404
 
 
@@ -1424,7 +2086,7 @@ def delete_all_exams():
         # Stop any active worker
         worker = background_worker.get_worker(eid)
         if worker:
-            db.update_exam(eid, status="paused")
+            db.update_exam_status(eid, "paused")
             worker.request_stop()
         if crud.delete_exam(eid):
             deleted_count += 1
@@ -1526,8 +2188,9 @@ def add_image(question_id: int):
         return jsonify({"error": "exam_name is required"}), 400
 
     # Save temp
-    temp_path = str(Path(app.config["UPLOAD_DIR"]) / file.filename)
-    file.save(temp_path)
+    temp_path = str(Path(app.config["UPLOAD_DIR"]) /
+                    f"{uuid.uuid4()}_{_upload_name(file.filename, 'image.png')}")
+    _save_upload(file.stream, temp_path)
 
     try:
         image_id = crud.add_image(
@@ -1553,10 +2216,41 @@ def run_server(
     host: str = "0.0.0.0",
     port: int = 5000,
     debug: bool = False,
+    use_gunicorn: Optional[bool] = None,
 ):
-    """Start the microservice server."""
+    """
+    Start the microservice server. Uses the threaded Werkzeug server unless
+    gunicorn is requested (use_gunicorn, or PARSER_USE_GUNICORN=1 when it is
+    None), in which case this process is replaced by gunicorn gthread
+    workers. Debug mode always uses Werkzeug.
+    """
+    if use_gunicorn is None:
+        use_gunicorn = os.getenv(
+            "PARSER_USE_GUNICORN", "").strip().lower() in {"1", "true", "yes", "on"}
+    gunicorn = shutil.which("gunicorn") if use_gunicorn else None
+    if use_gunicorn and debug:
+        logger.warning("Debug mode: ignoring the gunicorn request")
+    elif use_gunicorn and not gunicorn:
+        logger.warning("gunicorn requested but not found on PATH")
+    elif gunicorn:
+        threads = os.environ.get("PARSER_HTTP_THREADS", "16")
+        logger.info(
+            f"Starting gunicorn ({gunicorn}, 1 worker x {threads} threads) "
+            f"on {host}:{port}")
+        # One worker: job state is per-process (see JobStore)
+        os.execv(gunicorn, [
+            "gunicorn",
+            "--worker-class", "gthread",
+            "--workers", "1",
+            "--threads", threads,
+            "--timeout", "600",
+            "--bind", f"{host}:{port}",
+            "parser.wsgi:application",
+        ])
+
+    logger.info(f"Starting Werkzeug server on {host}:{port}")
     create_app()
-    app.run(host=host, port=port, debug=debug)
+    app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 if __name__ == "__main__":
@@ -111,6 +111,15 @@ IGNORE_PATTERNS = [
     re.compile(r"^\s*Select and Place:", re.IGNORECASE),
 ]
 
+# All noise patterns folded into one alternation, so a line is checked in a
+# single match() call instead of one per pattern. Each pattern keeps its own
+# case-sensitivity via a scoped flag group; match() anchors every branch at
+# the start of the line, exactly like matching the patterns one by one.
+IGNORE_RE = re.compile("|".join(
+    f"(?{'i' if p.flags & re.IGNORECASE else ''}:{p.pattern})"
+    for p in IGNORE_PATTERNS
+))
+
 # Cover page noise: standalone lines that are just a number or short exam code
 # These are only checked on pages where no question has been detected yet
 COVER_PAGE_NOISE = re.compile(
@@ -143,6 +152,10 @@ class StateMachineParser:
         self.questions: list[ParsedQuestion] = []
         self.question_numbers: set[int] = set()
         self._cover_page_done = False  # Track if we've moved past page 1
+        # Text lines buffered for one field (see _append_text)
+        self._text_owner = None
+        self._text_field = ""
+        self._text_parts: list[str] = []
 
     def reset(self):
         """Reset the state machine for a fresh parsing run."""
@@ -152,6 +165,8 @@ class StateMachineParser:
         self.questions = []
         self.question_numbers = set()
         self._cover_page_done = False
+        self._text_owner = None
+        self._text_parts = []
 
     def finalize(self):
         """Finalize any pending (in-progress) question at end of parsing."""
@@ -166,6 +181,8 @@ class StateMachineParser:
         self.questions = []
         self.question_numbers = set()
         self._cover_page_done = False
+        self._text_owner = None
+        self._text_parts = []
 
         for block in blocks:
             self._process_block(block)
@@ -183,7 +200,8 @@ class StateMachineParser:
         if block.type == BlockType.IMAGE:
             if not self.current_question:
                 logger.debug(
-                    f"Skipping orphan image (pre-amble) at page {block.page_number}")
+                    "Skipping orphan image (pre-amble) at page %d",
+                    block.page_number)
                 return
 
             self._assign_image(block)
@@ -225,7 +243,9 @@ class StateMachineParser:
             if self.current_question and self.state == ParserState.QUESTION_BODY:
                 if HOTSPOT_PATTERN.match(line_str):
                     self.current_question.question_type = QuestionType.HOTSPOT
-                    logger.info(f"Question {self.current_question.question_number} marked as HOTSPOT")
+                    logger.info(
+                        "Question %d marked as HOTSPOT",
+                        self.current_question.question_number)
                     continue
 
             if not self.current_question:
@@ -269,7 +289,7 @@ class StateMachineParser:
     def _is_noise(self, line: str, page_number: int) -> bool:
         """Check if a line is noise (headers, footers, boilerplate)."""
         # Standard noise patterns
-        if any(p.match(line) for p in IGNORE_PATTERNS):
+        if IGNORE_RE.match(line):
             return True
 
         # On the cover page (page 1, before any question detected),
@@ -288,7 +308,8 @@ class StateMachineParser:
         # We've definitely moved past the cover page
         self._cover_page_done = True
 
-        logger.info(f"Detected Question {q_num} on page {block.page_number}")
+        logger.info(
+            "Detected Question %d on page %d", q_num, block.page_number)
 
         self.current_question = ParsedQuestion(
             question_number=q_num,
@@ -306,34 +327,46 @@ class StateMachineParser:
         self.current_question.options.append(self.current_option)
 
     def _append_text(self, text: str):
-        """Append text to the active part of the current question."""
-        if not self.current_question:
+        """
+        Append text to the active part of the current question.
+
+        Lines are buffered per target field and joined once by
+        _flush_text(), instead of re-concatenating the field (and going
+        through pydantic's __setattr__) on every line.
+        """
+        q = self.current_question
+        if not q:
             return
 
         if self.state == ParserState.QUESTION_BODY:
-            if self.current_question.question_text:
-                self.current_question.question_text += " " + text
-            else:
-                self.current_question.question_text = text
-
+            owner, field = q, "question_text"
         elif self.state == ParserState.OPTION:
-            if self.current_option:
-                if self.current_option.text:
-                    self.current_option.text += " " + text
-                else:
-                    self.current_option.text = text
-
+            if not self.current_option:
+                return
+            owner, field = self.current_option, "text"
         elif self.state == ParserState.ANSWER:
-            if self.current_question.answer_text:
-                self.current_question.answer_text += " " + text
-            else:
-                self.current_question.answer_text = text
-
+            owner, field = q, "answer_text"
         elif self.state == ParserState.EXPLANATION:
-            if self.current_question.explanation_text:
-                self.current_question.explanation_text += " " + text
-            else:
-                self.current_question.explanation_text = text
+            owner, field = q, "explanation_text"
+        else:
+            return
+
+        if owner is not self._text_owner or field != self._text_field:
+            self._flush_text()
+            self._text_owner, self._text_field = owner, field
+        self._text_parts.append(text)
+
+    def _flush_text(self):
+        """Write buffered lines into their field, space-separated."""
+        if self._text_parts:
+            joined = " ".join(self._text_parts)
+            existing = getattr(self._text_owner, self._text_field)
+            setattr(
+                self._text_owner, self._text_field,
+                f"{existing} {joined}" if existing else joined,
+            )
+            self._text_parts = []
+        self._text_owner = None
 
     def _assign_image(self, block: ContentBlock):
         """Strict assignment of images based on state."""
@@ -341,7 +374,8 @@ class StateMachineParser:
         path = block.content
 
         # Debug logging as requested
-        print(f"[Q{q.question_number}] Assigning image to {self.state}")
+        logger.debug(
+            "[Q%d] Assigning image to %s", q.question_number, self.state)
 
         if self.state == ParserState.QUESTION_BODY:
             q.question_images.append(path)
@@ -367,6 +401,7 @@ class StateMachineParser:
 
     def _finalize_question(self):
         """Basic validation, answer marking, and storage."""
+        self._flush_text()
         q = self.current_question
         is_hotspot = q.question_type == QuestionType.HOTSPOT
 
@@ -380,11 +415,14 @@ class StateMachineParser:
         if q.explanation_text:
             cleaned = q.explanation_text.strip()
             # If explanation is just boilerplate noise, clear it
-            if any(p.match(cleaned) for p in IGNORE_PATTERNS):
+            if IGNORE_RE.match(cleaned):
                 q.explanation_text = ""
 
+        # Content is final from here on
+        q.finalize()
+
         if not q.has_question_text:
-            q.anomalies.append(Anomaly(
+            q.add_anomaly(Anomaly(
                 type=AnomalyType.MISSING_QUESTION_TEXT,
                 severity=80,
                 message="Question has no text content"
@@ -395,7 +433,7 @@ class StateMachineParser:
         # anomaly flagging for HOTSPOT questions
         if not is_hotspot:
             if not q.has_answer:
-                q.anomalies.append(Anomaly(
+                q.add_anomaly(Anomaly(
                     type=AnomalyType.MISSING_ANSWER,
                     severity=60,
                     message="Question has no answer section"
@@ -406,7 +444,7 @@ class StateMachineParser:
 
         # Check for orphan sections (images only)
         if not q.question_text and q.question_images:
-            q.anomalies.append(Anomaly(
+            q.add_anomaly(Anomaly(
                 type=AnomalyType.ORPHAN_IMAGE,
                 severity=30,
                 message="Question body contains only images",
@@ -12,6 +12,9 @@ const S = {
     questions: [],         // current questions list
     selectedQ: null,       // selected question number
     pollTimers: {},        // polling intervals
+    stream: null,          // shared EventSource for every followed job
+    streamJobs: new Set(), // job ids followed over `stream`
+    streamFailed: false,   // stream refused/dropped: poll from now on
     uploadFile: null,      // file to upload
 };
 
@@ -297,49 +300,104 @@ async function doUpload() {
 // JOB POLLING
 // ═══════════════════════════════════════════════════════════════════════════
 
+function stopPoll(jobId) {
+    if (S.streamJobs.delete(jobId) && S.streamJobs.size === 0) closeStream();
+    const t = S.pollTimers[jobId];
+    if (!t) return;
+    clearInterval(t);
+    delete S.pollTimers[jobId];
+}
+
 function startPoll(jobId) {
+    if (S.pollTimers[jobId] || S.streamJobs.has(jobId)) return;
+
+    // Prefer one server-sent event stream for all jobs; fall back to polling
+    if (window.EventSource && !S.streamFailed) {
+        S.streamJobs.add(jobId);
+        openStream();
+        return;
+    }
+    startStatusPoll(jobId);
+}
+
+function closeStream() {
+    if (S.stream) S.stream.close();
+    S.stream = null;
+}
+
+function openStream() {
+    // Reopened with the full id list whenever a job is added; the server
+    // re-sends each job's current status on connect
+    closeStream();
+    const ids = [...S.streamJobs].map(encodeURIComponent).join(',');
+    const es = new EventSource(`${API}/api/stream?jobs=${ids}`);
+    S.stream = es;
+    es.onmessage = (ev) => {
+        const d = JSON.parse(ev.data);
+        applyJobStatus(d.id, d);
+    };
+    es.addEventListener('gone', (ev) => stopPoll(JSON.parse(ev.data).id));
+    es.onerror = () => {
+        if (S.stream !== es) return;  // replaced or already finished
+        // Refused (server at its stream limit) or dropped: poll instead
+        closeStream();
+        S.streamFailed = true;
+        const ids = [...S.streamJobs];
+        S.streamJobs.clear();
+        ids.forEach(startStatusPoll);
+    };
+}
+
+function startStatusPoll(jobId) {
     if (S.pollTimers[jobId]) return;
     S.pollTimers[jobId] = setInterval(async () => {
         try {
             const r = await fetch(`${API}/api/status/${jobId}`);
             if (!r.ok) return;
-            const d = await r.json();
-
-            // Merge into state
-            S.jobs[jobId] = { ...S.jobs[jobId], ...d };
-
-            if (d.status === 'completed' || d.status === 'failed') {
-                clearInterval(S.pollTimers[jobId]);
-                delete S.pollTimers[jobId];
-
-                if (d.status === 'completed') {
-                    S.jobs[jobId].status = 'parsed';  // rename for display
-                    // fetch result metadata
-                    try {
-                        const rr = await fetch(`${API}/api/result/${jobId}`);
-                        if (rr.ok) {
-                            const result = await rr.json();
-                            S.jobs[jobId].pages = result.exam?.total_pages || null;
-                            S.jobs[jobId].questions_count = result.questions?.length || 0;
-                            const v = result.validation || {};
-                            const det = v.total_questions_detected || 0;
-                            const suc = v.structured_successfully || 0;
-                            S.jobs[jobId].confidence = det > 0 ? Math.round((suc / det) * 100) : 0;
-                            S.jobs[jobId]._result = result;
-                        }
-                    } catch { }
-                    toast(`✓ Parsed: ${S.jobs[jobId].filename || jobId}`, 'success');
-                } else {
-                    toast(`✗ Failed: ${d.error || 'Unknown error'}`, 'error');
-                }
-            }
-
-            renderImportsTable();
-            updateStatusCards();
+            await applyJobStatus(jobId, await r.json());
         } catch { }
     }, 1500);
 }
 
+async function applyJobStatus(jobId, d) {
+    if (!S.jobs[jobId]) {
+        stopPoll(jobId);  // removed from the table meanwhile
+        return;
+    }
+    try {
+        // Merge into state
+        S.jobs[jobId] = { ...S.jobs[jobId], ...d };
+
+        if (d.status === 'completed' || d.status === 'failed') {
+            stopPoll(jobId);
+
+            if (d.status === 'completed') {
+                S.jobs[jobId].status = 'parsed';  // rename for display
+                // fetch result metadata
+                try {
+                    const rr = await fetch(`${API}/api/result/${jobId}`);
+                    if (rr.ok) {
+                        const result = await rr.json();
+                        S.jobs[jobId].pages = result.exam?.total_pages || null;
+                        S.jobs[jobId].questions_count = result.questions?.length || 0;
+                        const v = result.validation || {};
+                        const det = v.total_questions_detected || 0;
+                        const suc = v.structured_successfully || 0;
+                        S.jobs[jobId].confidence = det > 0 ? Math.round((suc / det) * 100) : 0;
+                        S.jobs[jobId]._result = result;
+                    }
+                } catch { }
+                toast(`✓ Parsed: ${S.jobs[jobId].filename || jobId}`, 'success');
+            } else {
+                toast(`✗ Failed: ${d.error || 'Unknown error'}`, 'error');
+            }
+        }
+
+        renderImportsTable();
+        updateStatusCards();
+    } catch { }
+}
+
 // ═══════════════════════════════════════════════════════════════════════════
 // IMPORTS TABLE
 // ═══════════════════════════════════════════════════════════════════════════
@@ -487,10 +545,7 @@ async function deleteJob(jobId) {
     }
 
     delete S.jobs[jobId];
-    if (S.pollTimers[jobId]) {
-        clearInterval(S.pollTimers[jobId]);
-        delete S.pollTimers[jobId];
-    }
+    stopPoll(jobId);
     renderImportsTable();
     updateStatusCards();
     toast('Job deleted', 'info');
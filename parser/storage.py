@@ -13,16 +13,21 @@ Directory Layout:
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import mmap
 import os
+import re
 import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 # Project root: one level up from /parser/ package
-_PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 UPLOADS_DIR = _PROJECT_ROOT / "uploads"
 RAW_PDFS_DIR = UPLOADS_DIR / "raw_pdfs"
@@ -83,6 +88,91 @@ def delete_pdf(filename: str) -> bool:
     return False
 
 
+def compute_file_hash(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+    Maps the file into memory so the whole digest runs in a single C call.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mm).hexdigest()
+
+
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_ROOT_REF_RE = re.compile(rb"/Root\s+(\d+)\s+(\d+)\s+R")
+_PAGES_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)(?!\s+\d+\s+R)")
+
+
+def _find_object(mm: mmap.mmap, num: bytes, gen: bytes) -> Optional[bytes]:
+    """
+    Return the body of the last uncompressed definition of object num/gen.
+    Objects stored inside object streams are not found (returns None).
+    """
+    marker = re.compile(rb"(?<![0-9])" + num + rb"\s+" + gen + rb"\s+obj\b")
+    last = None
+    pos = 0
+    while True:
+        idx = mm.find(num + b" " + gen + b" obj", pos)
+        if idx < 0:
+            break
+        if idx == 0 or not mm[idx - 1:idx].isdigit():
+            last = idx
+        pos = idx + 1
+    if last is None:
+        return None
+    window = mm[last:last + 4096]
+    if not marker.match(window):
+        return None
+    end = window.find(b"endobj")
+    return window[:end] if end >= 0 else window
+
+
+def fast_page_count(path: str) -> Optional[int]:
+    """
+    Read a PDF's page count from its trailer without parsing the document.
+    Follows startxref -> /Root -> /Pages -> /Count. Returns None when the
+    structure can't be read this way (e.g. catalog inside an object stream),
+    so callers should fall back to a full parser.
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tail = mm[-65536:]
+                root = None
+                xref = _STARTXREF_RE.findall(tail)
+                if xref:
+                    # Trailer dict (classic xref) or xref stream dict
+                    off = int(xref[-1])
+                    root = _ROOT_REF_RE.search(mm[off:off + 65536])
+                if root is None:
+                    roots = _ROOT_REF_RE.findall(tail)
+                    if not roots:
+                        return None
+                    root_ref = roots[-1]
+                else:
+                    root_ref = root.groups()
+                catalog = _find_object(mm, *root_ref)
+                if catalog is None:
+                    return None
+                pages = _PAGES_REF_RE.search(catalog)
+                if pages is None:
+                    return None
+                pages_obj = _find_object(mm, *pages.groups())
+                if pages_obj is None:
+                    return None
+                count = _COUNT_RE.search(pages_obj)
+                return int(count.group(1)) if count else None
+    except (OSError, ValueError):
+        return None
+
+
 # ─── Image Storage ────────────────────────────────────────────────────────────
 
 
@@ -120,6 +210,8 @@ def save_image(source_path: str, exam_name: str, filename: str = None) -> str:
         shutil.copy2(source_path, dest)
 
     rel = dest.relative_to(_PROJECT_ROOT)
+    _add_to_index(
+        {rel.as_posix(): str(dest)}, {dest.name: {str(dest)}})
     return str(rel)
 
 
@@ -186,15 +278,96 @@ def resolve_image_path(relative_path: str) -> Optional[str]:
     Resolve a relative image path to an absolute path.
     Tries multiple base directories for compatibility.
     """
-    path = _resolve_path(relative_path)
-    return str(path) if path and path.exists() else None
+    path = _resolve_path(relative_path)  # only returns existing paths
+    return str(path) if path else None
+
+
+# ─── Image Index ──────────────────────────────────────────────────────────────
+# Serving an image by URL path is the dashboard's hot path. Indexed images
+# are keyed by their path relative to the project root and to the image base
+# directory they were indexed under, so a lookup is a dict probe and one stat
+# instead of a series of them. Bare file names live in a separate map and are
+# only served when exactly one indexed file carries that name.
+
+_image_paths: dict[str, str] = {}
+_image_names: dict[str, Optional[str]] = {}  # None = name used more than once
+_image_index_lock = threading.Lock()
+
+
+def _index_entries(base: Path, abs_path: str) -> list[str]:
+    keys = []
+    for parent in (base, _PROJECT_ROOT):
+        try:
+            keys.append(Path(abs_path).relative_to(parent).as_posix())
+        except ValueError:
+            pass
+    return keys
+
+
+def _add_to_index(entries: dict[str, str], names: dict[str, set]):
+    with _image_index_lock:
+        for key, abs_path in entries.items():
+            _image_paths.setdefault(key, abs_path)
+        for name, paths in names.items():
+            known = _image_names.get(name, "")
+            if known == "" and len(paths) == 1:
+                _image_names[name] = next(iter(paths))
+            elif known is not None and paths != {known}:
+                _image_names[name] = None
+
+
+def index_images(root, base=None) -> int:
+    """
+    Add every file under root to the image index. Keys are relative to
+    base (an image base directory, default root itself) and to the
+    project root. Returns the file count.
+    """
+    root = Path(root).absolute()
+    base = Path(base).absolute() if base is not None else root
+    entries: dict[str, str] = {}
+    names: dict[str, set] = {}
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            abs_path = os.path.join(dirpath, name)
+            for key in _index_entries(base, abs_path):
+                entries.setdefault(key, abs_path)
+            names.setdefault(name, set()).add(abs_path)
+    _add_to_index(entries, names)
+    return sum(len(paths) for paths in names.values())
+
+
+def lookup_image(image_path: str) -> Optional[str]:
+    """
+    Absolute path for an image URL path: the index first, then
+    resolve_image_path (whose hits are added to the index).
+    """
+    key = image_path.replace("\\", "/").lstrip("/")
+    with _image_index_lock:
+        path = _image_paths.get(key)
+    if path and os.path.isfile(path):
+        return path
+    path = resolve_image_path(image_path)
+    with _image_index_lock:
+        if path:
+            _image_paths[key] = path
+        else:
+            _image_paths.pop(key, None)
+    return path
+
+
+def lookup_image_name(filename: str) -> Optional[str]:
+    """Absolute path of an indexed image by bare file name, if unambiguous."""
+    with _image_index_lock:
+        path = _image_names.get(os.path.basename(filename))
+    return path if path and os.path.isfile(path) else None
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=1024)
 def _sanitize_name(name: str) -> str:
-    """Sanitize a name for filesystem use."""
+    """Sanitize a name for filesystem use (memoized: callers repeat names)."""
     return "".join(
         c if c.isalnum() or c in "-_ " else "_"
         for c in name
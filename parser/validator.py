@@ -76,8 +76,6 @@ class ValidationEngine:
 
         # Analyze each question
         structured_count = 0
-        orphan_image_count = 0
-        anomaly_counts: dict[str, int] = {}
 
         for q in questions:
             # Check if question is fully structured
@@ -99,17 +97,14 @@ class ValidationEngine:
             if not q.has_explanation:
                 report.questions_missing_explanation.append(q.question_number)
 
-            # Count anomalies by type
-            for anomaly in q.anomalies:
-                key = anomaly.type.value
-                anomaly_counts[key] = anomaly_counts.get(key, 0) + 1
-
-                if anomaly.type == AnomalyType.ORPHAN_IMAGE:
-                    orphan_image_count += 1
+        # Count anomalies by type in a single C-level tally
+        anomaly_counts = Counter(
+            a.type.value for q in questions for a in q.anomalies
+        )
 
         report.structured_successfully = structured_count
-        report.orphan_images = orphan_image_count
-        report.anomaly_breakdown = anomaly_counts
+        report.orphan_images = anomaly_counts[AnomalyType.ORPHAN_IMAGE.value]
+        report.anomaly_breakdown = dict(anomaly_counts)
 
         # Log summary
         logger.info("=" * 60)
@@ -0,0 +1,14 @@
+"""
+WSGI Entry Point
+================
+For production servers, e.g.:
+
+    gunicorn -w 1 -k gthread --threads 16 --timeout 600 parser.wsgi:application
+
+Keep a single worker process: the job store lives in memory, and parsing
+already fans out to its own process pool.
+"""
+
+from .server import create_app
+
+application = create_app()
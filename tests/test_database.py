@@ -0,0 +1,265 @@
+"""
+Tests for the SQLite Layer
+==========================
+Batch writer transactions, exam blobs and schema migrations in
+parser.database.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from parser import database as db
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("PARSER_BLOBS_DB_PATH", raising=False)
+    path = str(tmp_path / "test.sqlite")
+    db.init_db(path)
+    return path
+
+
+@pytest.fixture
+def exam_id(db_path):
+    return db.insert_exam(name="Test Exam", db_path=db_path)
+
+
+def _question(number: int) -> dict:
+    return {
+        "question_number": number,
+        "question_text": f"Question {number}?",
+        "answer_text": "A",
+        "page_start": 1,
+        "page_end": 1,
+        "options": [{"key": "A", "text": "Yes"}],
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QUESTION BATCH WRITER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestQuestionBatchWriter:
+    """Page batches become visible to readers only when checkpointed."""
+
+    def test_checkpoint_makes_batch_visible(self, db_path, exam_id):
+        writer = db.QuestionBatchWriter(exam_id, db_path=db_path)
+        writer.add(_question(1))
+        writer.add(_question(2))
+        db.update_exam_current_page(exam_id, 1, db_path=db_path, join=True)
+        assert writer.pending == 2
+
+        # Uncommitted: the read connection sees neither rows nor checkpoint
+        assert db.count_exam_questions(exam_id, db_path=db_path) == 0
+        assert db.get_exam(exam_id, db_path=db_path)["current_page"] == 0
+
+        writer.checkpoint()
+        assert writer.pending == 0
+        assert db.count_exam_questions(exam_id, db_path=db_path) == 2
+        assert db.get_exam(exam_id, db_path=db_path)["current_page"] == 1
+
+    def test_rollback_discards_batch_and_joined_writes(self, db_path, exam_id):
+        writer = db.QuestionBatchWriter(exam_id, db_path=db_path)
+        writer.add(_question(1))
+        db.update_exam_current_page(exam_id, 1, db_path=db_path, join=True)
+        writer.checkpoint()
+
+        writer.add(_question(2))
+        db.update_exam_current_page(exam_id, 2, db_path=db_path, join=True)
+        writer.rollback()
+
+        assert db.count_exam_questions(exam_id, db_path=db_path) == 1
+        assert db.get_exam(exam_id, db_path=db_path)["current_page"] == 1
+
+    def test_add_replaces_same_question_number(self, db_path, exam_id):
+        with db.QuestionBatchWriter(exam_id, db_path=db_path) as writer:
+            writer.add(_question(1))
+            writer.add({**_question(1), "question_text": "Replaced?"})
+        questions = db.get_exam_questions(exam_id, db_path=db_path)
+        assert [q["question_text"] for q in questions] == ["Replaced?"]
+
+    def test_context_manager_rolls_back_on_error(self, db_path, exam_id):
+        with pytest.raises(RuntimeError):
+            with db.QuestionBatchWriter(exam_id, db_path=db_path) as writer:
+                writer.add(_question(1))
+                raise RuntimeError("page failed")
+        assert db.count_exam_questions(exam_id, db_path=db_path) == 0
+
+    def test_unjoined_write_during_batch_raises(self, db_path, exam_id):
+        writer = db.QuestionBatchWriter(exam_id, db_path=db_path)
+        writer.add(_question(1))
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.update_exam_current_page(exam_id, 1, db_path=db_path)
+        writer.rollback()
+
+        # With no batch open, the same call commits on its own
+        assert db.update_exam_current_page(exam_id, 3, db_path=db_path)
+        assert db.get_exam(exam_id, db_path=db_path)["current_page"] == 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EXAM BLOBS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestExamBlobs:
+    """JSON blobs are read only when, and only the kinds, asked for."""
+
+    @pytest.fixture
+    def blob_exam(self, db_path):
+        exam_id = db.insert_exam(
+            name="Blob Exam", job_id="job-1", result_json='{"r": 1}',
+            db_path=db_path)
+        db.update_exam(exam_id, db_path=db_path, validation_json='{"v": 1}')
+        return exam_id
+
+    def test_blobs_need_include_blobs(self, db_path, blob_exam):
+        exam = db.get_exam(blob_exam, db_path=db_path)
+        assert "result_json" not in exam
+        assert "validation_json" not in exam
+
+    def test_all_kinds_by_default(self, db_path, blob_exam):
+        exam = db.get_exam(blob_exam, db_path=db_path, include_blobs=True)
+        assert exam["result_json"] == '{"r": 1}'
+        assert exam["validation_json"] == '{"v": 1}'
+
+    def test_only_requested_kinds(self, db_path, blob_exam):
+        exam = db.get_exam(
+            blob_exam, db_path=db_path, include_blobs=True,
+            kinds=("validation_json",))
+        assert exam["validation_json"] == '{"v": 1}'
+        assert "result_json" not in exam
+
+    def test_missing_kind_is_empty(self, db_path, exam_id):
+        exam = db.get_exam(
+            exam_id, db_path=db_path, include_blobs=True,
+            kinds=("validation_json",))
+        assert exam["validation_json"] == ""
+
+    def test_by_job_id_has_no_blobs_by_default(self, db_path, blob_exam):
+        exam = db.get_exam_by_job_id("job-1", db_path=db_path)
+        assert exam["id"] == blob_exam
+        assert "result_json" not in exam
+        exam = db.get_exam_by_job_id(
+            "job-1", db_path=db_path, kinds=("result_json",))
+        assert exam["result_json"] == '{"r": 1}'
+        assert "validation_json" not in exam
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MIGRATIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Schema of the released (unversioned) baseline, before the status columns
+# were added, with an exam row that still carries its JSON inline.
+_BASELINE_SCHEMA = """
+    CREATE TABLE exams (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        file_path TEXT,
+        source_pdf TEXT,
+        file_hash TEXT,
+        file_size_bytes INTEGER DEFAULT 0,
+        total_pages INTEGER DEFAULT 0,
+        total_questions INTEGER DEFAULT 0,
+        provider TEXT DEFAULT '',
+        version TEXT DEFAULT '',
+        parser_version TEXT DEFAULT '1.0.0',
+        result_json TEXT DEFAULT '',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE questions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        exam_id INTEGER NOT NULL,
+        question_number INTEGER NOT NULL,
+        question_type TEXT DEFAULT 'mcq',
+        question_text TEXT DEFAULT '',
+        answer_text TEXT DEFAULT '',
+        explanation_text TEXT DEFAULT '',
+        page_start INTEGER DEFAULT 0,
+        page_end INTEGER DEFAULT 0,
+        raw_text TEXT DEFAULT '',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY(exam_id) REFERENCES exams(id) ON DELETE CASCADE
+    );
+    CREATE TABLE options (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        question_id INTEGER NOT NULL,
+        option_key TEXT NOT NULL,
+        option_text TEXT DEFAULT '',
+        is_correct INTEGER DEFAULT 0,
+        FOREIGN KEY(question_id) REFERENCES questions(id) ON DELETE CASCADE
+    );
+    CREATE TABLE question_images (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        question_id INTEGER NOT NULL,
+        section TEXT NOT NULL,
+        option_key TEXT,
+        image_path TEXT NOT NULL,
+        block_order INTEGER DEFAULT 0,
+        FOREIGN KEY(question_id) REFERENCES questions(id) ON DELETE CASCADE
+    );
+    CREATE INDEX idx_images_section ON question_images(question_id, section);
+
+    INSERT INTO exams (name, result_json) VALUES ('Old Exam', '{"questions": []}');
+    INSERT INTO questions (exam_id, question_number, question_text)
+        VALUES (1, 1, 'Kept?');
+"""
+
+
+class TestMigrations:
+    """init_db() upgrades a baseline database to the current schema."""
+
+    @pytest.fixture
+    def baseline_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("PARSER_BLOBS_DB_PATH", raising=False)
+        path = str(tmp_path / "old.sqlite")
+        conn = sqlite3.connect(path)
+        conn.executescript(_BASELINE_SCHEMA)
+        conn.close()
+        return path
+
+    @staticmethod
+    def _inspect(path: str) -> tuple[int, set, set, str]:
+        conn = sqlite3.connect(path)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(exams)")}
+            indexes = {r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+            inline = conn.execute(
+                "SELECT result_json FROM exams WHERE id = 1").fetchone()[0]
+        finally:
+            conn.close()
+        return version, cols, indexes, inline
+
+    def test_baseline_to_current(self, baseline_path):
+        db.init_db(baseline_path)
+
+        version, cols, indexes, inline = self._inspect(baseline_path)
+        assert version == db._SCHEMA_VERSION == 5
+        assert {"job_id", "status", "current_page", "last_error",
+                "validation_json", "original_filename"} <= cols
+        assert "idx_images_section" not in indexes
+        assert "idx_images_qsection_order" in indexes
+        # JSON moved to the side database, not left inline
+        assert inline == ""
+
+        exam = db.get_exam(1, db_path=baseline_path, include_blobs=True)
+        assert exam["result_json"] == '{"questions": []}'
+        assert exam["status"] == "pending"
+        questions = db.get_exam_questions(1, db_path=baseline_path)
+        assert [q["question_text"] for q in questions] == ["Kept?"]
+
+    def test_migration_runs_once(self, baseline_path):
+        db.init_db(baseline_path)
+        db.update_exam_status(1, "completed", db_path=baseline_path)
+        db.init_db(baseline_path)
+
+        exam = db.get_exam(1, db_path=baseline_path, include_blobs=True)
+        assert exam["status"] == "completed"
+        assert exam["result_json"] == '{"questions": []}'
@@ -0,0 +1,71 @@
+"""
+Tests for the Parser Engine Output
+==================================
+Snapshot files written by parser.engine.ParserEngine.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+from parser.engine import ParserConfig, ParserEngine
+from parser.models import BlockType, ContentBlock
+
+
+def _blocks(count: int) -> list[ContentBlock]:
+    return [
+        ContentBlock(
+            type=BlockType.TEXT,
+            content=f"Block {i}",
+            page_number=1,
+            bbox=(0.0, float(i), 100.0, float(i + 1)),
+            order_index=i,
+        )
+        for i in range(count)
+    ]
+
+
+def _engine(tmp_path, **overrides) -> ParserEngine:
+    return ParserEngine(ParserConfig(output_dir=str(tmp_path), **overrides))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RAW BLOCKS SNAPSHOT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestSaveRawBlocks:
+    """Raw blocks keep their .json name unless gzip is opted into."""
+
+    def test_gzip_off_by_default(self, tmp_path):
+        engine = _engine(tmp_path)
+        assert engine.config.raw_blocks_gzip_threshold == 0
+        engine._save_raw_blocks(_blocks(20), tmp_path / "e_raw_blocks.json")
+
+        assert not (tmp_path / "e_raw_blocks.json.gz").exists()
+        data = json.loads((tmp_path / "e_raw_blocks.json").read_bytes())
+        assert [b["content"] for b in data] == [f"Block {i}" for i in range(20)]
+
+    def test_at_threshold_stays_plain_json(self, tmp_path):
+        engine = _engine(tmp_path, raw_blocks_gzip_threshold=10)
+        engine._save_raw_blocks(_blocks(10), tmp_path / "e_raw_blocks.json")
+
+        assert not (tmp_path / "e_raw_blocks.json.gz").exists()
+        data = json.loads((tmp_path / "e_raw_blocks.json").read_bytes())
+        assert len(data) == 10
+
+    def test_over_threshold_writes_gzip(self, tmp_path):
+        engine = _engine(tmp_path, raw_blocks_gzip_threshold=10)
+        engine._save_raw_blocks(_blocks(11), tmp_path / "e_raw_blocks.json")
+
+        assert not (tmp_path / "e_raw_blocks.json").exists()
+        with gzip.open(tmp_path / "e_raw_blocks.json.gz", "rb") as f:
+            data = json.loads(f.read())
+        assert len(data) == 11
+        assert data[-1]["bbox"] == [0.0, 10.0, 100.0, 11.0]
+
+    def test_empty_snapshot(self, tmp_path):
+        engine = _engine(tmp_path, pretty_json=True)
+        engine._save_raw_blocks([], tmp_path / "e_raw_blocks.json")
+        assert json.loads((tmp_path / "e_raw_blocks.json").read_bytes()) == []
@@ -0,0 +1,136 @@
+"""
+Tests for the Job Store
+=======================
+Eviction and change notification in parser.jobstore.JobStore.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from parser.jobstore import JobStore
+
+
+def _job(job_id: str, status: str = "completed", completed_at=None,
+         batch_id=None) -> dict:
+    return {
+        "id": job_id,
+        "status": status,
+        "progress": 100 if status == "completed" else 0,
+        "completed_at": completed_at,
+        "batch_id": batch_id,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PRUNE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestPrune:
+    """Finished jobs leave by age, then oldest-first past max_jobs."""
+
+    def test_expired_jobs_are_evicted(self):
+        store = JobStore()
+        now = time.time()
+        store.create_many([
+            _job("old", completed_at=now - 100),
+            _job("new", completed_at=now),
+        ])
+        evicted = store.prune(retention=50, max_jobs=10)
+        assert [j["id"] for j in evicted] == ["old"]
+        assert store.get("old") is None
+        assert store.get("new") is not None
+
+    def test_overflow_evicts_oldest_completed_first(self):
+        store = JobStore()
+        now = time.time()
+        # Inserted newest first, so insertion order is the wrong answer
+        store.create_many([
+            _job("c", completed_at=now - 1),
+            _job("b", completed_at=now - 2),
+            _job("a", completed_at=now - 3),
+        ])
+        evicted = store.prune(retention=3600, max_jobs=1)
+        assert [j["id"] for j in evicted] == ["a", "b"]
+        assert [j["id"] for j in store.all()] == ["c"]
+
+    def test_active_jobs_are_never_evicted(self):
+        store = JobStore()
+        store.create_many([
+            _job("q", status="queued"),
+            _job("p", status="processing"),
+            _job("done", completed_at=time.time()),
+        ])
+        evicted = store.prune(retention=0, max_jobs=0)
+        assert [j["id"] for j in evicted] == ["done"]
+        assert {j["id"] for j in store.list_active()} == {"q", "p"}
+        assert store.status_counts() == {"queued": 1, "processing": 1}
+
+    def test_evicted_jobs_leave_the_batch_index(self):
+        store = JobStore()
+        now = time.time()
+        store.create_many([
+            _job("a", completed_at=now - 100, batch_id="b1"),
+            _job("b", status="processing", batch_id="b1"),
+        ])
+        store.prune(retention=50, max_jobs=10)
+        assert [j["id"] for j in store.batch("b1")] == ["b"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WATCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestWatch:
+    """watch() returns as soon as status/progress moves off `last`."""
+
+    def test_first_call_returns_immediately(self):
+        store = JobStore()
+        store.create(_job("j", status="queued"))
+        assert store.watch("j", None, timeout=5)["status"] == "queued"
+
+    def test_timeout_returns_unchanged_snapshot(self):
+        store = JobStore()
+        store.create(_job("j", status="queued"))
+        start = time.monotonic()
+        job = store.watch("j", ("queued", 0), timeout=0.1)
+        assert time.monotonic() - start >= 0.1
+        assert (job["status"], job["progress"]) == ("queued", 0)
+
+    def test_wakes_on_progress(self):
+        store = JobStore()
+        store.create(_job("j", status="processing"))
+        timer = threading.Timer(0.05, store.set_progress, ("j", 40))
+        timer.start()
+        try:
+            job = store.watch("j", ("processing", 0), timeout=5)
+        finally:
+            timer.cancel()
+        assert job["progress"] == 40
+
+    def test_gone_job_returns_none(self):
+        store = JobStore()
+        store.create(_job("j", status="processing"))
+        timer = threading.Timer(0.05, store.delete, ("j",))
+        timer.start()
+        try:
+            assert store.watch("j", ("processing", 0), timeout=5) is None
+        finally:
+            timer.cancel()
+
+    def test_watch_many_reports_only_changed_jobs(self):
+        store = JobStore()
+        store.create_many([
+            _job("a", status="processing"),
+            _job("b", status="processing"),
+        ])
+        last = {"a": ("processing", 0), "b": ("processing", 0)}
+        assert store.watch_many(["a", "b"], last, timeout=0.05) == {}
+
+        store.update("b", status="completed", progress=100)
+        changed = store.watch_many(["a", "b"], last, timeout=5)
+        assert list(changed) == ["b"]
+        assert changed["b"]["status"] == "completed"
@@ -0,0 +1,193 @@
+"""
+Tests for the HTTP Service Upload Path
+======================================
+Multipart spooling into UPLOAD_DIR, the read cache, result files and app
+setup in parser.server.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+
+import pytest
+
+from parser import server
+
+_PDF = b"%PDF-1.4\n" + b"0" * 50_000 + b"\n%%EOF\n"
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(server.app.config, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _multipart(content: bytes, filename: str = "exam.pdf"):
+    return server.app.test_request_context(
+        "/api/parse", method="POST",
+        data={"file": (io.BytesIO(content), filename)},
+        content_type="multipart/form-data",
+    )
+
+
+def _parts(upload_dir) -> list[str]:
+    return [n for n in os.listdir(upload_dir) if n.endswith(".part")]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MULTIPART SPOOLING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestUploadSpooling:
+    """File parts are written once, into UPLOAD_DIR, then renamed."""
+
+    def test_part_is_spooled_into_upload_dir(self, upload_dir):
+        with _multipart(_PDF):
+            stream = server.request.files["file"].stream
+            assert os.path.dirname(stream.name) == str(upload_dir)
+            assert len(_parts(upload_dir)) == 1
+
+    def test_pdf_part_is_renamed_into_place(self, upload_dir):
+        dest = str(upload_dir / "job_exam.pdf")
+        with _multipart(_PDF):
+            file = server.request.files["file"]
+            saved = server._save_upload(file.stream, dest, require_pdf=True)
+
+        assert saved == (hashlib.sha256(_PDF).hexdigest(), len(_PDF))
+        with open(dest, "rb") as f:
+            assert f.read() == _PDF
+        assert _parts(upload_dir) == []
+
+    def test_rejected_part_is_removed(self, upload_dir):
+        dest = str(upload_dir / "job_notes.pdf")
+        with _multipart(b"just some text", "notes.pdf"):
+            file = server.request.files["file"]
+            assert server._save_upload(
+                file.stream, dest, require_pdf=True) is None
+
+        assert not os.path.exists(dest)
+        assert _parts(upload_dir) == []
+
+    def test_unread_part_is_removed(self, upload_dir):
+        with _multipart(_PDF):
+            server.request.files["file"]
+        assert _parts(upload_dir) == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# UPLOAD NAMES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestUploadName:
+    """Client file names are made filesystem-safe without losing the suffix."""
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("exam.pdf", "exam.pdf"),
+        ("My Exam.PDF", "My_Exam.PDF"),
+        ("../../etc/exam.pdf", "etc_exam.pdf"),
+        ("考试.pdf", "upload.pdf"),
+        ("考试", "upload.pdf"),
+        ("", "upload.pdf"),
+        (None, "upload.pdf"),
+    ])
+    def test_pdf_names(self, filename, expected):
+        assert server._upload_name(filename) == expected
+
+    def test_non_ascii_keeps_original_extension(self):
+        assert server._upload_name("图片.jpg", "image.png") == "image.jpg"
+        assert server._upload_name("图片", "image.png") == "image.png"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# READ CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestReadCache:
+    """Memoized reads expire and the cache stays bounded."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setattr(server, "_read_cache", server.OrderedDict())
+
+    def test_hit_within_ttl(self):
+        calls = []
+        for _ in range(3):
+            server._cached_read(("k",), lambda: calls.append(1), ttl=60)
+        assert len(calls) == 1
+
+    def test_expired_entry_is_reloaded(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+        assert server._cached_read(("k",), lambda: "old", ttl=5) == "old"
+        now[0] += 10
+        assert server._cached_read(("k",), lambda: "new", ttl=5) == "new"
+        assert len(server._read_cache) == 1
+
+    def test_size_is_capped_lru(self, monkeypatch):
+        monkeypatch.setattr(server, "READ_CACHE_MAX_ENTRIES", 3)
+        for i in range(3):
+            server._cached_read((i,), lambda: i, ttl=60)
+        server._cached_read((0,), lambda: "reloaded", ttl=60)  # refresh 0
+        server._cached_read((3,), lambda: 3, ttl=60)
+        assert list(server._read_cache) == [(2,), (0,), (3,)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RESULT FILES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestResultFile:
+    """A completed job's result file is served from OUTPUT_DIR."""
+
+    def test_relative_output_dir_resolves_against_cwd(
+            self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setitem(server.app.config, "OUTPUT_DIR", "output")
+        monkeypatch.setitem(server.app.config, "ABSOLUTE_IMAGE_URLS", False)
+        job_id = "result-file-job"
+        server.jobs.create(
+            {"id": job_id, "status": "completed", "result_json": None})
+        try:
+            (tmp_path / "output" / "jobs").mkdir(parents=True)
+            (tmp_path / "output" / "jobs" / f"{job_id}.result.json"
+             ).write_text('{"questions": []}')
+            response = server.app.test_client().get(f"/api/result/{job_id}")
+            assert response.status_code == 200
+            assert response.get_json() == {"questions": []}
+        finally:
+            server.jobs.delete(job_id)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# APP SETUP
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestCreateApp:
+    """create_app() can run more than once per process."""
+
+    @pytest.fixture
+    def app_dirs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server.fs_storage, "init_storage", lambda: None)
+        monkeypatch.setattr(server.db, "init_db", lambda: None)
+        # Other tests may already have sent requests to the shared app
+        monkeypatch.setattr(server.app, "_got_first_request", False)
+        for key in ("UPLOAD_DIR", "OUTPUT_DIR", "IMAGE_BASE_DIR"):
+            monkeypatch.setitem(server.app.config, key, str(tmp_path / key))
+        return tmp_path
+
+    def test_second_call_keeps_routes(self, app_dirs):
+        assert server.create_app() is server.app
+        assert server.create_app() is server.app
+        assert "serve_output" in server.app.view_functions
+
+        (app_dirs / "OUTPUT_DIR" / "a.json").write_text("{}")
+        response = server.app.test_client().get("/output/a.json")
+        assert response.status_code == 200
+        assert response.get_data() == b"{}"
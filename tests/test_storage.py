@@ -0,0 +1,170 @@
+"""
+Tests for Filesystem Storage Helpers
+====================================
+Trailer-based page counting and the image index in parser.storage.
+"""
+
+from __future__ import annotations
+
+import fitz
+import pytest
+
+from parser import storage
+from parser.storage import fast_page_count
+
+
+def _write_pdf(path, objects: list[bytes]) -> str:
+    """Write objects 1..n with a classic xref table; object 1 is the catalog."""
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref
+    path.write_bytes(bytes(out))
+    return str(path)
+
+
+def _fitz_pdf(path, pages: int, **save_kwargs) -> str:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(str(path), **save_kwargs)
+    doc.close()
+    return str(path)
+
+
+def _page(parent: int) -> bytes:
+    return b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] >>" % parent
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FAST PAGE COUNT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestFastPageCount:
+    """Page count read from the trailer, or None when it can't be."""
+
+    def test_classic_xref(self, tmp_path):
+        path = _fitz_pdf(tmp_path / "a.pdf", 7)
+        assert fast_page_count(path) == 7
+
+    def test_incremental_update_uses_latest_trailer(self, tmp_path):
+        path = _fitz_pdf(tmp_path / "a.pdf", 3)
+        doc = fitz.open(path)
+        doc.new_page()
+        doc.new_page()
+        doc.saveIncr()
+        doc.close()
+
+        with open(path, "rb") as f:
+            assert f.read().count(b"startxref") == 2
+        assert fast_page_count(path) == 5
+
+    def test_nested_pages_tree_reads_root_count(self, tmp_path):
+        path = _write_pdf(tmp_path / "nested.pdf", [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 3 >>",
+            b"<< /Type /Pages /Parent 2 0 R /Kids [5 0 R 6 0 R] /Count 2 >>",
+            _page(2),
+            _page(3),
+            _page(3),
+        ])
+        assert fitz.open(path).page_count == 3
+        assert fast_page_count(path) == 3
+
+    def test_indirect_count_is_not_read(self, tmp_path):
+        path = _write_pdf(tmp_path / "indirect.pdf", [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [4 0 R] /Count 3 0 R >>",
+            b"1",
+            _page(2),
+        ])
+        assert fast_page_count(path) is None
+
+    def test_object_streams_return_none(self, tmp_path):
+        path = _fitz_pdf(tmp_path / "objstm.pdf", 4, use_objstms=True)
+        with open(path, "rb") as f:
+            data = f.read()
+        assert b"/ObjStm" in data and b"/XRef" in data
+        assert fast_page_count(path) is None
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"not a pdf at all",
+        bytes(range(256)) * 64,
+        b"%PDF-1.4\nstartxref\n99999999\n%%EOF\n",
+        b"%PDF-1.4\ntrailer << /Root 9 0 R >>\nstartxref\n0\n%%EOF\n",
+    ])
+    def test_garbage_returns_none(self, tmp_path, content):
+        path = tmp_path / "junk.pdf"
+        path.write_bytes(content)
+        assert fast_page_count(str(path)) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert fast_page_count(str(tmp_path / "missing.pdf")) is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# IMAGE INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def image_index(monkeypatch):
+    """Run against an empty image index."""
+    monkeypatch.setattr(storage, "_image_paths", {})
+    monkeypatch.setattr(storage, "_image_names", {})
+
+
+@pytest.fixture
+def two_exams(tmp_path, image_index):
+    """Two exam directories under one image base, each with q1_img1.png."""
+    base = tmp_path / "questions"
+    paths = {}
+    for exam in ("exam_a", "exam_b"):
+        (base / exam).mkdir(parents=True)
+        path = base / exam / "q1_img1.png"
+        path.write_bytes(exam.encode())
+        paths[exam] = str(path.absolute())
+    return base, paths
+
+
+class TestImageIndex:
+    """Index lookups return the same file resolve_image_path would, or none."""
+
+    def test_keys_are_relative_to_base(self, two_exams):
+        base, paths = two_exams
+        for exam in paths:
+            assert storage.index_images(base / exam, base=base) == 1
+        assert storage.lookup_image("exam_a/q1_img1.png") == paths["exam_a"]
+        assert storage.lookup_image("exam_b/q1_img1.png") == paths["exam_b"]
+
+    def test_shared_name_is_not_claimed_by_one_exam(self, two_exams):
+        base, paths = two_exams
+        for exam in paths:
+            storage.index_images(base / exam, base=base)
+        assert "q1_img1.png" not in storage._image_paths
+        assert storage.lookup_image("q1_img1.png") is None
+        assert storage.lookup_image("questions/q1_img1.png") is None
+        assert storage.lookup_image_name("q1_img1.png") is None
+
+    def test_unique_name_resolves_by_name(self, tmp_path, image_index):
+        path = tmp_path / "questions" / "exam_a" / "q2_img1.png"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"a")
+        storage.index_images(path.parent, base=tmp_path / "questions")
+        assert "q2_img1.png" not in storage._image_paths
+        assert storage.lookup_image_name("q2_img1.png") == str(path.absolute())
+
+    def test_root_is_default_base(self, two_exams):
+        base, paths = two_exams
+        assert storage.index_images(base) == 2
+        assert storage.lookup_image("exam_b/q1_img1.png") == paths["exam_b"]
+        assert storage.lookup_image_name("q1_img1.png") is None